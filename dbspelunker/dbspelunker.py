@@ -1,26 +1,34 @@
 import asyncio
 import logging
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel
 
-from .genai import GeminiModel
+from .genai import Agent, GeminiModel
 from .models import (
     DatabaseOverview,
     DocumentationReport,
     RelationshipInfo,
     SchemaInfo,
     StoredProcedureInfo,
+    TableDoc,
     TableInfo,
     TriggerInfo,
+    index_relationships_by_table,
 )
 from .tools import (
+    DatabaseConnector,
     analyze_relationships_tool,
     generate_table_summary_prompt,
     get_database_overview_tool,
     get_table_schema_tool,
+    get_tables_schema_tool,
 )
 
+# Cap on AI summary requests in flight during full documentation runs
+_MAX_AI_CONCURRENCY = 8
+
 
 class ResponseModel(BaseModel):
     out: str
@@ -50,13 +58,33 @@ class DBSpelunker:
     def analyze_table(
         self, table_name: str, schema_name: Optional[str] = None
     ) -> TableInfo:
-        return get_table_schema_tool(self.db_connection_str, table_name, schema_name)
+        return get_table_schema_tool(
+            self.db_connection_str, table_name, schema_name, include_triggers=True
+        )
+
+    async def _summarize(
+        self,
+        agent: Agent[ResponseModel],
+        prompt: str,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> str:
+        """Run a summary agent, holding `semaphore` (the AI request limit) if given."""
+        if semaphore is None:
+            return (await agent.run(prompt)).out
+        async with semaphore:
+            return (await agent.run(prompt)).out
 
     async def generate_table_summary_async(
-        self, table_info: TableInfo, relationships: list[RelationshipInfo]
+        self,
+        table_info: TableInfo,
+        relationships: list[RelationshipInfo],
+        relationship_index: Optional[Dict[str, List[RelationshipInfo]]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> str:
         try:
-            prompt = generate_table_summary_prompt(table_info, relationships)
+            prompt = generate_table_summary_prompt(
+                table_info, relationships, relationship_index
+            )
 
             # Create a simple agent for text generation
             summary_agent = self.gemini.new_agent(
@@ -66,8 +94,7 @@ class DBSpelunker:
                 tools=None,
             )
 
-            response = await summary_agent.run(prompt)
-            return response.out
+            return await self._summarize(summary_agent, prompt, semaphore)
         except Exception as e:
             self.logger.warning(
                 f"Failed to generate AI summary for table {table_info.name}: {str(e)}"
@@ -75,7 +102,10 @@ class DBSpelunker:
             return f"Table {table_info.name} contains {len(table_info.columns)} columns and stores data related to the business domain."
 
     async def generate_trigger_summary_async(
-        self, trigger_info: TriggerInfo, table_info: TableInfo
+        self,
+        trigger_info: TriggerInfo,
+        table_info: TableInfo,
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> str:
         try:
             from .tools import generate_trigger_summary_prompt
@@ -90,8 +120,7 @@ class DBSpelunker:
                 tools=None,
             )
 
-            response = await summary_agent.run(prompt)
-            return response.out
+            return await self._summarize(summary_agent, prompt, semaphore)
         except Exception as e:
             self.logger.warning(
                 f"Failed to generate AI summary for trigger {trigger_info.name}: {str(e)}"
@@ -99,7 +128,10 @@ class DBSpelunker:
             return f"Trigger {trigger_info.name} implements {trigger_info.timing.value} {trigger_info.event.value} logic for {trigger_info.table_name}."
 
     async def generate_stored_procedure_summary_async(
-        self, procedure_info: StoredProcedureInfo, schema_tables: List[TableInfo]
+        self,
+        procedure_info: StoredProcedureInfo,
+        schema_tables: List[TableInfo],
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> str:
         try:
             from .tools import generate_stored_procedure_summary_prompt
@@ -116,8 +148,7 @@ class DBSpelunker:
                 tools=None,
             )
 
-            response = await summary_agent.run(prompt)
-            return response.out
+            return await self._summarize(summary_agent, prompt, semaphore)
         except Exception as e:
             self.logger.warning(
                 f"Failed to generate AI summary for procedure {procedure_info.name}: {str(e)}"
@@ -134,23 +165,30 @@ class DBSpelunker:
         if not target_schema:
             raise ValueError(f"Schema '{schema_name}' not found in database")
 
-        # Analyze each table in the schema
-        analyzed_tables = []
-        for table in target_schema.tables:
-            table_info = get_table_schema_tool(
-                self.db_connection_str, table.name, schema_name
-            )
-            analyzed_tables.append(table_info)
+        # One connector for the whole schema walk, so its inspector's reflection
+        # cache is shared by every tool below
+        connector = DatabaseConnector(self.db_connection_str)
+
+        # Analyze every table in the schema with batched reflection
+        analyzed_tables = get_tables_schema_tool(
+            self.db_connection_str,
+            schema_name,
+            [table.name for table in target_schema.tables],
+            include_triggers=True,
+            connector=connector,
+        )
 
         # Get relationships for the schema
-        relationships = analyze_relationships_tool(self.db_connection_str, schema_name)
+        relationships = analyze_relationships_tool(
+            self.db_connection_str, schema_name, connector=connector
+        )
 
         # Get stored procedures for the schema (this is already done in overview,
         # but we want to make sure we have the most up-to-date data)
         from .tools import get_stored_procedures_tool
 
         stored_procedures = get_stored_procedures_tool(
-            self.db_connection_str, schema_name
+            self.db_connection_str, schema_name, connector=connector
         )
 
         return SchemaInfo(
@@ -161,48 +199,107 @@ class DBSpelunker:
             relationships=relationships,
         )
 
-    def generate_full_documentation(self) -> DocumentationReport:
+    def generate_full_documentation(
+        self, overview: Optional[DatabaseOverview] = None
+    ) -> DocumentationReport:
+        """
+        Blocking wrapper around generate_full_documentation_async.
+
+        Inside a running event loop (Jupyter, async handlers) asyncio.run is not
+        allowed, so the run gets its own loop on a helper thread; async callers
+        should await generate_full_documentation_async instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(
+                self.generate_full_documentation_async(overview=overview)
+            )
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(
+                asyncio.run, self.generate_full_documentation_async(overview=overview)
+            ).result()
+
+    async def generate_full_documentation_async(
+        self,
+        concurrency: int = _MAX_AI_CONCURRENCY,
+        overview: Optional[DatabaseOverview] = None,
+    ) -> DocumentationReport:
+        """Document the whole database with up to `concurrency` AI requests in flight.
+
+        Pass an `overview` the caller already fetched to skip re-collecting it.
+        """
         self.logger.info("Starting full database documentation generation...")
 
         # Get basic overview for metadata
-        basic_overview = self.get_database_overview()
+        basic_overview = (
+            overview
+            if overview is not None
+            else await asyncio.to_thread(self.get_database_overview)
+        )
 
-        # Analyze each schema with full details and AI summaries
-        all_schemas_info = []
+        # Local to this run, so concurrent runs on one instance keep their limits
+        semaphore = asyncio.Semaphore(concurrency)
+
+        # Introspect schemas one at a time, starting each schema's AI
+        # summaries as soon as it is analyzed so they overlap the next one
+        enhancements = []
         for schema in basic_overview.schemas:
             self.logger.info(f"Analyzing schema: {schema.name}")
-            schema_info = self.analyze_schema(schema.name)
-
-            # Generate AI summaries for tables and stored procedures asynchronously
-            self.logger.info(
-                f"Generating AI summaries for {len(schema_info.tables)} tables and {len(schema_info.stored_procedures)} procedures concurrently..."
+            schema_info = await asyncio.to_thread(self.analyze_schema, schema.name)
+            enhancements.append(
+                asyncio.create_task(self._enhance_schema_async(schema_info, semaphore))
             )
+        all_schemas_info = list(await asyncio.gather(*enhancements))
 
-            # Run both table and procedure enhancements concurrently
-            async def run_enhancements() -> tuple[
-                List[TableInfo], List[StoredProcedureInfo]
-            ]:
-                return await asyncio.gather(
-                    self._generate_enhanced_tables_async(
-                        schema_info.tables, schema_info.relationships
-                    ),
-                    self._generate_enhanced_stored_procedures_async(
-                        schema_info.stored_procedures, schema_info.tables
-                    ),
-                )
+        return self._build_documentation_report(basic_overview, all_schemas_info)
 
-            enhanced_tables, enhanced_procedures = asyncio.run(run_enhancements())
+    async def _enhance_schema_async(
+        self, schema_info: SchemaInfo, semaphore: Optional[asyncio.Semaphore] = None
+    ) -> SchemaInfo:
+        # Generate AI summaries for tables and stored procedures asynchronously
+        self.logger.info(
+            f"Generating AI summaries for {len(schema_info.tables)} tables and {len(schema_info.stored_procedures)} procedures concurrently..."
+        )
 
-            # Update schema with enhanced tables and procedures
-            enhanced_schema = SchemaInfo(
-                name=schema_info.name,
-                tables=enhanced_tables,
-                views=schema_info.views,
-                stored_procedures=enhanced_procedures,
-                relationships=schema_info.relationships,
-                description=schema_info.description,
-            )
-            all_schemas_info.append(enhanced_schema)
+        # Run both table and procedure enhancements concurrently
+        enhanced_tables, enhanced_procedures = await asyncio.gather(
+            self._generate_enhanced_tables_async(
+                schema_info.tables, schema_info.relationships, semaphore
+            ),
+            self._generate_enhanced_stored_procedures_async(
+                schema_info.stored_procedures, schema_info.tables, semaphore
+            ),
+        )
+
+        # Update schema with enhanced tables and procedures
+        return SchemaInfo(
+            name=schema_info.name,
+            tables=enhanced_tables,
+            views=schema_info.views,
+            stored_procedures=enhanced_procedures,
+            relationships=schema_info.relationships,
+            description=schema_info.description,
+        )
+
+    def _build_documentation_report(
+        self, basic_overview: DatabaseOverview, all_schemas_info: List[SchemaInfo]
+    ) -> DocumentationReport:
+        # Tally every per-table count in a single walk over the analyzed schemas
+        total_tables = total_views = total_stored_procedures = 0
+        total_relationships = total_columns = total_constraints = 0
+        total_indexes = total_triggers = 0
+        for schema in all_schemas_info:
+            total_tables += len(schema.tables)
+            total_views += len(schema.views)
+            total_stored_procedures += len(schema.stored_procedures)
+            total_relationships += len(schema.relationships)
+            for table in schema.tables:
+                total_columns += len(table.columns)
+                total_constraints += len(table.constraints)
+                total_indexes += len(table.indexes)
+                total_triggers += len(table.triggers)
 
         # Create updated overview with analyzed data
         from datetime import datetime
@@ -212,19 +309,11 @@ class DBSpelunker:
             database_type=basic_overview.database_type,
             version=basic_overview.version,
             schemas=all_schemas_info,  # Use the analyzed schemas with full data
-            total_tables=sum(len(schema.tables) for schema in all_schemas_info),
-            total_views=sum(len(schema.views) for schema in all_schemas_info),
-            total_stored_procedures=sum(
-                len(schema.stored_procedures) for schema in all_schemas_info
-            ),
-            total_triggers=sum(
-                sum(len(table.triggers) for table in schema.tables)
-                for schema in all_schemas_info
-            ),
-            total_indexes=sum(
-                sum(len(table.indexes) for table in schema.tables)
-                for schema in all_schemas_info
-            ),
+            total_tables=total_tables,
+            total_views=total_views,
+            total_stored_procedures=total_stored_procedures,
+            total_triggers=total_triggers,
+            total_indexes=total_indexes,
             database_size_bytes=basic_overview.database_size_bytes,
             character_set=basic_overview.character_set,
             collation=basic_overview.collation,
@@ -232,18 +321,6 @@ class DBSpelunker:
         )
 
         # Generate executive summary
-        total_relationships = sum(
-            len(schema.relationships) for schema in all_schemas_info
-        )
-        total_columns = sum(
-            sum(len(table.columns) for table in schema.tables)
-            for schema in all_schemas_info
-        )
-        total_constraints = sum(
-            sum(len(table.constraints) for table in schema.tables)
-            for schema in all_schemas_info
-        )
-
         executive_summary = f"""
 Database Analysis Summary:
 - Database: {updated_overview.name} ({updated_overview.database_type.value})
@@ -260,12 +337,17 @@ The analysis identified {total_relationships} foreign key relationships between
         """.strip()
 
         # Generate detailed table documentation
-        table_docs = []
+        table_docs: List[TableDoc] = []
         for schema in all_schemas_info:
             for table in schema.tables:
                 # Create detailed documentation for each table
-                pk_columns = [col.name for col in table.columns if col.is_primary_key]
-                fk_columns = [col.name for col in table.columns if col.is_foreign_key]
+                pk_columns: List[str] = []
+                fk_columns: List[str] = []
+                for col in table.columns:
+                    if col.is_primary_key:
+                        pk_columns.append(col.name)
+                    if col.is_foreign_key:
+                        fk_columns.append(col.name)
 
                 # Build documentation with AI insights
                 doc_parts = [
@@ -304,10 +386,10 @@ The analysis identified {total_relationships} foreign key relationships between
 
                 doc = "\n".join(doc_parts)
 
-                table_docs.append({"table_name": table.name, "documentation": doc})
+                table_docs.append(TableDoc(table_name=table.name, documentation=doc))
 
         # Sort table documentation alphabetically by table name
-        table_docs.sort(key=lambda x: x["table_name"])
+        table_docs.sort(key=lambda x: x.table_name)
 
         # Generate relationship analysis
         relationship_details = []
@@ -390,18 +472,24 @@ Found {len(all_indexes)} indexes across all tables:
         return ". ".join(parts) + "."
 
     async def _generate_enhanced_tables_async(
-        self, tables: list[TableInfo], relationships: list[RelationshipInfo]
+        self,
+        tables: list[TableInfo],
+        relationships: list[RelationshipInfo],
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> list[TableInfo]:
+        # Index once so each table only looks at its own relationships
+        relationship_index = index_relationships_by_table(relationships)
+
         async def enhance_single_table(table: TableInfo) -> TableInfo:
             try:
                 # Generate AI summary asynchronously
                 ai_summary = await self.generate_table_summary_async(
-                    table, relationships
+                    table, relationships, relationship_index, semaphore
                 )
 
                 # Enhance triggers with AI summaries
                 enhanced_triggers = await self._generate_enhanced_triggers_async(
-                    table.triggers, table
+                    table.triggers, table, semaphore
                 )
 
                 # Create enhanced table with AI summary and enhanced triggers
@@ -420,7 +508,7 @@ Found {len(all_indexes)} indexes across all tables:
                     description=table.description,
                     ai_summary=ai_summary,
                     relationship_summary=self._generate_relationship_summary(
-                        table, relationships
+                        table, relationship_index.get(table.name, [])
                     ),
                 )
 
@@ -436,7 +524,10 @@ Found {len(all_indexes)} indexes across all tables:
         return list(enhanced_tables)
 
     async def _generate_enhanced_triggers_async(
-        self, triggers: list[TriggerInfo], table_info: TableInfo
+        self,
+        triggers: list[TriggerInfo],
+        table_info: TableInfo,
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> list[TriggerInfo]:
         """Generate AI summaries for triggers asynchronously."""
 
@@ -444,7 +535,7 @@ Found {len(all_indexes)} indexes across all tables:
             try:
                 # Generate AI summary for the trigger
                 ai_summary = await self.generate_trigger_summary_async(
-                    trigger, table_info
+                    trigger, table_info, semaphore
                 )
 
                 # Create enhanced trigger with AI summary
@@ -477,7 +568,10 @@ Found {len(all_indexes)} indexes across all tables:
         return list(enhanced_triggers)
 
     async def _generate_enhanced_stored_procedures_async(
-        self, procedures: list[StoredProcedureInfo], schema_tables: list[TableInfo]
+        self,
+        procedures: list[StoredProcedureInfo],
+        schema_tables: list[TableInfo],
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> list[StoredProcedureInfo]:
         """Generate AI summaries for stored procedures asynchronously."""
 
@@ -487,7 +581,7 @@ Found {len(all_indexes)} indexes across all tables:
             try:
                 # Generate AI summary for the procedure
                 ai_summary = await self.generate_stored_procedure_summary_async(
-                    procedure, schema_tables
+                    procedure, schema_tables, semaphore
                 )
 
                 # Create enhanced procedure with AI summary
@@ -1,9 +1,9 @@
 from datetime import datetime
 from enum import StrEnum
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Self, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class DatabaseType(StrEnum):
@@ -78,7 +78,17 @@ class ConstraintType(StrEnum):
     DEFAULT = "default"
 
 
-class ColumnInfo(BaseModel):
+class CatalogModel(BaseModel):
+    @classmethod
+    def from_catalog(cls, **values: Any) -> Self:
+        """
+        Build an instance from trusted catalog data without running validation.
+        Callers must pass already-typed values (enum members, not strings).
+        """
+        return cls.model_construct(**values)
+
+
+class ColumnInfo(CatalogModel):
     name: str
     data_type: ColumnType
     is_nullable: bool
@@ -93,7 +103,7 @@ class ColumnInfo(BaseModel):
     description: Optional[str] = None
 
 
-class ConstraintInfo(BaseModel):
+class ConstraintInfo(CatalogModel):
     name: str
     type: ConstraintType
     columns: List[str]
@@ -105,7 +115,7 @@ class ConstraintInfo(BaseModel):
     description: Optional[str] = None
 
 
-class IndexInfo(BaseModel):
+class IndexInfo(CatalogModel):
     name: str
     table_name: str
     index_type: IndexType
@@ -128,10 +138,16 @@ class TriggerInfo(BaseModel):
     ai_summary: Optional[str] = None
 
 
+class ProcParameter(BaseModel):
+    name: str
+    type: str
+    mode: Optional[str] = None
+
+
 class StoredProcedureInfo(BaseModel):
     name: str
     schema_name: Optional[str] = None
-    parameters: List[Dict[str, str]] = Field(default_factory=list)
+    parameters: List[ProcParameter] = Field(default_factory=list)
     return_type: Optional[str] = None
     definition: str
     language: Optional[str] = None
@@ -171,6 +187,18 @@ class RelationshipInfo(BaseModel):
     relationship_type: RelationshipType = RelationshipType.ONE_TO_MANY
 
 
+def index_relationships_by_table(
+    relationships: List[RelationshipInfo],
+) -> Dict[str, List[RelationshipInfo]]:
+    """Relationships keyed by every table they touch, as source or target."""
+    index: Dict[str, List[RelationshipInfo]] = {}
+    for rel in relationships:
+        index.setdefault(rel.source_table, []).append(rel)
+        if rel.target_table != rel.source_table:
+            index.setdefault(rel.target_table, []).append(rel)
+    return index
+
+
 class SchemaInfo(BaseModel):
     name: str
     tables: List[TableInfo]
@@ -202,10 +230,28 @@ class DocumentationSection(BaseModel):
     subsections: List["DocumentationSection"] = Field(default_factory=list)
 
 
+class TableDoc(BaseModel):
+    table_name: str = "Untitled"
+    documentation: str = ""
+
+    @model_validator(mode="before")
+    @classmethod
+    def _accept_common_keys(cls, data: Any) -> Any:
+        # Hand-written entries often use "content" or "markdown" for the body;
+        # the first non-empty of content, documentation, markdown wins.
+        if isinstance(data, dict):
+            body = (
+                data.get("content") or data.get("documentation") or data.get("markdown")
+            )
+            if body:
+                data = {**data, "documentation": body}
+        return data
+
+
 class DocumentationReport(BaseModel):
     database_overview: DatabaseOverview
     executive_summary: str
-    table_documentation: List[Dict[str, str]]
+    table_documentation: List[TableDoc]
     relationship_analysis: str
     index_analysis: str
     performance_insights: List[str] = Field(default_factory=list)
@@ -260,14 +306,10 @@ class DocumentationReport(BaseModel):
         def _bytes(n: Optional[int]) -> str:
             if n is None:
                 return ""
-            step = 1024.0
-            units = ["B", "KB", "MB", "GB", "TB", "PB"]
-            idx = 0
-            f = float(n)
-            while f >= step and idx < len(units) - 1:
-                f /= step
-                idx += 1
-            return f"{f:,.2f} {units[idx]}"
+            units = ("B", "KB", "MB", "GB", "TB", "PB")
+            # Each unit is 2**10 of the previous one, so the bit length picks it
+            idx = min((n.bit_length() - 1) // 10, len(units) - 1) if n > 0 else 0
+            return f"{n / (1 << (10 * idx)):,.2f} {units[idx]}"
 
         def _dt(d: Optional[datetime]) -> str:
             if not d:
@@ -280,19 +322,14 @@ class DocumentationReport(BaseModel):
 
         def _kv_table(rows: List[tuple[str, str]]) -> str:
             # rows: List[(key, value)]
-            out = ["| Key | Value |", "| --- | ----- |"]
-            for k, v in rows:
-                out.append(f"| {_esc(k)} | {_esc(v)} |")
-            return "\n".join(out)
+            body = (f"| {_esc(k)} | {_esc(v)} |" for k, v in rows)
+            return "\n".join(["| Key | Value |", "| --- | ----- |", *body])
 
         def _md_table(headers: List[str], rows: List[List[str]]) -> str:
-            out = [
-                "| " + " | ".join(_esc(h) for h in headers) + " |",
-                "| " + " | ".join("---" for _ in headers) + " |",
-            ]
-            for r in rows:
-                out.append("| " + " | ".join(_esc(c) for c in r) + " |")
-            return "\n".join(out)
+            header = "| " + " | ".join(map(_esc, headers)) + " |"
+            divider = "| " + " | ".join(["---"] * len(headers)) + " |"
+            body = ("| " + " | ".join(map(_esc, r)) + " |" for r in rows)
+            return "\n".join([header, divider, *body])
 
         def _truncate_block(sql: str) -> str:
             if sql is None:
@@ -414,6 +451,7 @@ class DocumentationReport(BaseModel):
             if schema.tables:
                 lines.append(_h(4, "Tables"))
                 lines.append("")
+                relationship_index = index_relationships_by_table(schema.relationships)
                 # Sort tables alphabetically by name
                 for t in sorted(schema.tables, key=lambda x: x.name):
                     fq = (
@@ -598,11 +636,7 @@ class DocumentationReport(BaseModel):
                                 lines.append(_truncate_block(trg.definition))
 
                     # Relationships touching this table (from schema.relationships)
-                    rels = [
-                        r
-                        for r in schema.relationships
-                        if r.source_table == t.name or r.target_table == t.name
-                    ]
+                    rels = relationship_index.get(t.name, [])
                     if rels:
                         lines.append("")
                         lines.append(_h(6, "Related Tables"))
@@ -903,15 +937,9 @@ class DocumentationReport(BaseModel):
             lines.append(_h(2, "Table Documentation"))
             lines.append("")
             for entry in self.table_documentation:
-                # accept common keys
-                title = entry.get("table_name") or "Untitled"
-                content = (
-                    entry.get("content")
-                    or entry.get("documentation")
-                    or entry.get("markdown")
-                    or ""
-                )
-                lines.append(_h(3, str(title)))
+                title = entry.table_name or "Untitled"
+                content = entry.documentation
+                lines.append(_h(3, title))
                 if content.strip():
                     lines.append("")
                     lines.append(content.strip())
@@ -934,7 +962,14 @@ class DocumentationReport(BaseModel):
             lines.append("```")
             lines.append("")
 
-        markdown = "\n".join(lines).rstrip() + "\n"
+        # Trim trailing whitespace on the line list so the (possibly large)
+        # joined document is built once instead of copied by rstrip and +
+        while lines and not lines[-1].strip():
+            lines.pop()
+        if lines:
+            lines[-1] = lines[-1].rstrip()
+        lines.append("")
+        markdown = "\n".join(lines)
 
         # Optionally write to disk
         if path is not None:
@@ -1,7 +1,7 @@
 import re
-import textwrap
-from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Literal, Optional, Self, Union
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Dict, Iterable, List, Literal, Mapping, Optional, Self, Union
 
 BlockKind = Literal["markdown", "code", "json", "yaml", "text"]
 
@@ -123,6 +123,23 @@ class PromptBuilder:
         self.metadata[_clean_inline(key)] = _clean_inline(value)
         return self
 
+    def extend_metadata(self, items: Mapping[str, str]) -> Self:
+        """Add metadata entries that are already clean, skipping normalization."""
+        self.metadata.update(items)
+        return self
+
+    def clone(self) -> Self:
+        """Copy whose sections can be extended without touching this builder."""
+        return replace(
+            self,
+            instructions=list(self.instructions),
+            rules=list(self.rules),
+            supporting=list(self.supporting),
+            examples=list(self.examples),
+            extra_sections=list(self.extra_sections),
+            metadata=dict(self.metadata),
+        )
+
     def render(self, options: Optional[RenderOptions] = None) -> str:
         opt = options or RenderOptions()
         if opt.strict_validate:
@@ -131,75 +148,83 @@ class PromptBuilder:
         def H(level: int) -> str:
             return "#" * max(1, opt.base_heading_level + (level - 1))
 
+        h1, h2, h3, h4 = H(1), H(2), H(3), H(4)
+
+        # Headings and stripped one-liners never carry trailing whitespace, so
+        # only block bodies and bullet lists (an empty item renders as "* ")
+        # need to go through tidy.
+        tidy = _strip_trailing_ws if opt.strip_trailing_whitespace else str
+
         parts: List[str] = []
 
         if self.title:
-            parts.append(f"{H(1)} {self.title}")
+            parts.append(f"{h1} {self.title}")
 
         if opt.include_toc:
             parts.append(self._render_toc())
 
         if self.instructions:
-            parts.append(f"{H(2)} Instructions")
-            parts.append(_bullets(self.instructions))
+            parts.append(f"{h2} Instructions")
+            parts.append(tidy(_bullets(self.instructions)))
 
         if self.rules:
-            parts.append(f"{H(2)} Rules")
-            parts.append(_bullets(self.rules))
+            parts.append(f"{h2} Rules")
+            parts.append(tidy(_bullets(self.rules)))
 
         if self.output_desc:
-            parts.append(f"{H(2)} Output")
+            parts.append(f"{h2} Output")
             parts.append(
-                f"{H(4)} Return output exactly formatted specified below with NO formatting, markdown, or code blocks. Check Field Descriptions for field level details."
+                f"{h4} Return output exactly formatted specified below with NO formatting, markdown, or code blocks. Check Field Descriptions for field level details."
             )
             parts.append(self.output_desc.strip())
 
         if self.validation:
-            parts.append(f"{H(2)} Validation")
+            parts.append(f"{h2} Validation")
             parts.append(self.validation.strip())
 
         if self.supporting:
-            parts.append(f"{H(2)} Supporting information")
+            parts.append(f"{h2} Supporting information")
             for i, block in enumerate(self.supporting, 1):
-                section_title = f"{H(3)} {block.title or f'Item {i}'}"
-                content = _render_block(block.body, block.kind, block.language)
+                section_title = f"{h3} {block.title or f'Item {i}'}"
+                content = tidy(_render_block(block.body, block.kind, block.language))
                 if opt.collapse_supporting_info:
                     parts.append(_details(section_title, content))
                 else:
                     parts.append(section_title)
-                    parts.append(content)
+                    if content:
+                        parts.append(content)
 
         if self.examples:
-            parts.append(f"{H(2)} Example")
+            parts.append(f"{h2} Example")
             for idx, ex in enumerate(self.examples, 1):
                 subtitle = ex.title or f"Example {idx}"
-                parts.append(f"{H(3)} {subtitle}")
-                parts.append(_render_block(ex.body, ex.kind, ex.language))
+                parts.append(f"{h3} {subtitle}")
+                content = tidy(_render_block(ex.body, ex.kind, ex.language))
+                if content:
+                    parts.append(content)
 
         for name, section_content in self.extra_sections:
-            parts.append(f"{H(2)} {name}")
+            parts.append(f"{h2} {name}")
             if isinstance(section_content, str):
-                parts.append(section_content.strip())
+                content = tidy(section_content.strip())
             else:
-                parts.append(_bullets([_clean(x) for x in section_content]))
+                content = tidy(_bullets([_clean(x) for x in section_content]))
+            if content:
+                parts.append(content)
 
         if self.summary:
-            parts.append(f"{H(2)} Summary")
+            parts.append(f"{h2} Summary")
             parts.append(self.summary.strip())
         else:
-            parts.append(f"{H(2)} Summary")
+            parts.append(f"{h2} Summary")
             parts.append(self._auto_summary())
 
         if self.metadata:
             meta_lines = " ".join(f'{k}="{v}"' for k, v in self.metadata.items())
             parts.append(f"<!-- metadata: {meta_lines} -->")
 
-        doc = "\n\n".join(p for p in parts if p and p.strip())
-
-        if opt.strip_trailing_whitespace:
-            doc = _strip_trailing_ws(doc)
-
-        return doc
+        # Every part appended above is non-empty and already stripped.
+        return "\n\n".join(parts)
 
     def _validate(self) -> None:
         if not self.title:
@@ -267,13 +292,20 @@ def _clean_inline(text: str) -> str:
 
 
 def _dedent_preserve(text: str) -> str:
-    return textwrap.dedent(text).rstrip("\n")
+    # No line starts with a space or tab, so dedent would return text as-is.
+    if not text.startswith((" ", "\t")) and "\n " not in text and "\n\t" not in text:
+        return text.rstrip("\n")
+
+    from textwrap import dedent
+
+    return dedent(text).rstrip("\n")
 
 
 def _bullets(items: Iterable[str]) -> str:
-    return "\n".join(f"* {line}" for line in items)
+    return "\n".join(["* " + line for line in items])
 
 
+@lru_cache(maxsize=256)
 def _slug(s: str) -> str:
     s = s.strip().lower()
     s = not_word_re.sub("", s)
@@ -1,9 +1,30 @@
 import re
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+)
 
 import sqlparse
-from sqlalchemy import create_engine, inspect, text
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, inspect, make_url, text
+from sqlalchemy.engine import Engine, Inspector, RowMapping
+from sqlalchemy.engine.interfaces import (
+    ReflectedColumn,
+    ReflectedForeignKeyConstraint,
+    ReflectedIndex,
+    ReflectedPrimaryKeyConstraint,
+    TableKey,
+)
 from sqlalchemy.exc import SQLAlchemyError
 
 from .models import (
@@ -15,16 +36,21 @@ from .models import (
     DatabaseType,
     IndexInfo,
     IndexType,
+    ProcParameter,
     RelationshipInfo,
     RelationshipType,
     SchemaInfo,
     StoredProcedureInfo,
     TableInfo,
+    TriggerEvent,
     TriggerInfo,
+    TriggerTiming,
 )
 from .prompt_builder import PromptBuilder, RenderOptions
 
 
+# Trigger and routine bodies are formatted again every time a report renders
+@lru_cache(maxsize=2048)
 def format_sql(sql: str) -> str:
     """
     Format SQL code for better readability in documentation.
@@ -70,8 +96,10 @@ def format_sql(sql: str) -> str:
         return sql.strip()
 
 
-class SQLSafetyValidator:
-    FORBIDDEN_KEYWORDS = {
+_ALLOWED_FIRST_WORDS = frozenset({"SELECT", "SHOW", "DESCRIBE", "EXPLAIN", "WITH"})
+
+_FORBIDDEN_KEYWORDS = frozenset(
+    {
         "INSERT",
         "UPDATE",
         "DELETE",
@@ -86,71 +114,350 @@ class SQLSafetyValidator:
         "SAVEPOINT",
         "MERGE",
     }
+)
+
+
+# Whole-word match, so keywords glued to punctuation ("1;DELETE", "(DROP")
+# are caught while identifiers such as created_at or update_time are not.
+# A leading "." marks a qualified column name (t.update), not a statement.
+_FORBIDDEN_RE = re.compile(
+    r"(?<!\.)\b(?:" + "|".join(sorted(_FORBIDDEN_KEYWORDS)) + r")\b", re.IGNORECASE
+)
+
+# Comments, string literals and quoted identifiers, matched left to right so a
+# quote inside a comment (or a comment marker inside a string) is not misread.
+# Only forms that PostgreSQL, MySQL and SQLite all read the same way match:
+# "--" must be followed by whitespace, "/*!" is executable on MySQL, and a
+# backslash inside quotes is an escape on MySQL (and in E'' strings) but not
+# elsewhere. Anything else stays in place for _SQL_AMBIGUOUS_RE to reject.
+_SQL_OPAQUE_RE = re.compile(
+    r"--(?=\s|$)[^\r\n]*|/\*(?!!).*?\*/"
+    r"|'(?:[^'\\]|'')*'|\"(?:[^\"\\]|\"\")*\"|`(?:[^`\\]|``)*`",
+    re.DOTALL,
+)
+
+# Left outside the opaque spans, these mean the dialects may split the query
+# differently (dollar quoting, "#" comments, nested or unterminated comments,
+# unterminated or backslash-escaped literals), so validation fails closed.
+_SQL_AMBIGUOUS_RE = re.compile(r"['\"`\\#]|--|/\*|\*/|\$(?:[A-Za-z_]\w*)?\$")
+
+
+def _sql_code_only(sql: str) -> Optional[str]:
+    """Blank out comments, literals and quoted identifiers, or return None if
+    the query could be tokenized differently by the database."""
+    parts: List[str] = []
+    pos = 0
+    for m in _SQL_OPAQUE_RE.finditer(sql):
+        # PostgreSQL nests block comments, so an inner "/*" moves the end
+        if m.group().startswith("/*") and "/*" in m.group()[2:]:
+            return None
+        parts.append(sql[pos : m.start()])
+        parts.append(" ")
+        pos = m.end()
+    parts.append(sql[pos:])
+
+    code = "".join(parts)
+    return None if _SQL_AMBIGUOUS_RE.search(code) else code
 
+
+class SQLSafetyValidator:
     @classmethod
     def validate_readonly_sql(cls, sql: str) -> bool:
-        normalized = re.sub(r"\s+", " ", sql.upper().strip())
-        words = normalized.split()
+        # Reject on the leading keyword before scanning the rest of the query
+        words = sql.upper().split()
+        if not words or words[0] not in _ALLOWED_FIRST_WORDS:
+            return False
 
-        if not words:
+        # Backstop on the raw text: no forbidden keyword as a bare word anywhere,
+        # comments included, whatever the tokenizer below makes of it
+        if not _FORBIDDEN_KEYWORDS.isdisjoint(words):
             return False
 
-        first_word = words[0]
-        if first_word not in {"SELECT", "SHOW", "DESCRIBE", "EXPLAIN", "WITH"}:
+        # Only inspect the SQL itself: a ";" or keyword inside a literal, a
+        # quoted identifier or a comment can't start another statement
+        code = _sql_code_only(sql)
+        if code is None:
             return False
+        body = code.rstrip()
+
+        # A single statement only; one trailing terminator is allowed
+        if ";" in (body[:-1] if body.endswith(";") else body):
+            return False
+
+        return _FORBIDDEN_RE.search(body) is None
+
+
+# Connection pool defaults for networked backends; small, since this is a
+# read-only documentation tool sharing the server with real workloads
+_POOL_SIZE = 5
+_MAX_OVERFLOW = 10
+
+
+@lru_cache(maxsize=32)
+def _get_engine(
+    connection_string: str,
+    pool_size: int = _POOL_SIZE,
+    max_overflow: int = _MAX_OVERFLOW,
+) -> Engine:
+    """Return a process-wide engine (and connection pool) per connection string."""
+    if make_url(connection_string).get_backend_name() == "sqlite":
+        # SQLite picks its own pool class, not all of which accept sizing
+        return create_engine(connection_string, pool_pre_ping=True)
+
+    return create_engine(
+        connection_string,
+        pool_pre_ping=True,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+    )
+
 
-        for keyword in cls.FORBIDDEN_KEYWORDS:
-            if keyword in words:
-                return False
+_DIALECT_MAP = {
+    "postgresql": DatabaseType.POSTGRESQL,
+    "mysql": DatabaseType.MYSQL,
+    "sqlite": DatabaseType.SQLITE,
+    "mssql": DatabaseType.SQLSERVER,
+    "oracle": DatabaseType.ORACLE,
+}
 
-        return True
+
+@dataclass(frozen=True)
+class SchemaReflection:
+    columns: Dict[TableKey, List[ReflectedColumn]]
+    pk_constraints: Dict[TableKey, ReflectedPrimaryKeyConstraint]
+    foreign_keys: Dict[TableKey, List[ReflectedForeignKeyConstraint]]
+    indexes: Dict[TableKey, List[ReflectedIndex]]
 
 
 class DatabaseConnector:
-    def __init__(self, connection_string: str):
+    def __init__(
+        self,
+        connection_string: str,
+        pool_size: int = _POOL_SIZE,
+        max_overflow: int = _MAX_OVERFLOW,
+    ):
         self.connection_string = connection_string
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
         self._engine: Optional[Engine] = None
+        # Inspectors are not thread-safe, so each worker thread gets its own
+        self._inspectors = threading.local()
+        self._reflections: Dict[Optional[str], SchemaReflection] = {}
+        self._database_type: Optional[DatabaseType] = None
 
     def get_engine(self) -> Engine:
         if not self._engine:
-            self._engine = create_engine(self.connection_string)
+            self._engine = _get_engine(
+                self.connection_string, self.pool_size, self.max_overflow
+            )
         return self._engine
 
-    def execute_safe_sql(self, sql: str) -> List[Dict[str, Any]]:
+    def get_inspector(self) -> Inspector:
+        inspector: Optional[Inspector] = getattr(self._inspectors, "inspector", None)
+        if inspector is None:
+            inspector = inspect(self.get_engine())
+            self._inspectors.inspector = inspector
+        return inspector
+
+    def reflect_schema(self, schema_name: Optional[str] = None) -> "SchemaReflection":
+        """Reflect every table of a schema in bulk, memoized per connector."""
+        reflection = self._reflections.get(schema_name)
+        if reflection is None:
+            inspector = self.get_inspector()
+            reflection = SchemaReflection(
+                columns=dict(inspector.get_multi_columns(schema=schema_name)),
+                pk_constraints=dict(
+                    inspector.get_multi_pk_constraint(schema=schema_name)
+                ),
+                foreign_keys=dict(inspector.get_multi_foreign_keys(schema=schema_name)),
+                indexes=dict(inspector.get_multi_indexes(schema=schema_name)),
+            )
+            self._reflections[schema_name] = reflection
+        return reflection
+
+    def execute_safe_sql(
+        self, sql: str, params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
         if not SQLSafetyValidator.validate_readonly_sql(sql):
             raise ValueError(f"SQL query is not safe for read-only execution: {sql}")
 
         try:
             engine = self.get_engine()
             with engine.connect() as conn:
-                result = conn.execute(text(sql))
+                result = conn.execute(text(sql), params or {})
                 return [dict(row._mapping) for row in result]
         except SQLAlchemyError as e:
             raise RuntimeError(f"Database query failed: {str(e)}")
 
+    def execute_internal(
+        self, sql: str, params: Optional[Dict[str, Any]] = None
+    ) -> Sequence[RowMapping]:
+        """
+        Execute one of this module's own catalog queries with bound parameters.
+
+        Skips the read-only validation done by execute_safe_sql, so it must never
+        be given caller-supplied SQL text; values go through params only.
+        """
+        try:
+            engine = self.get_engine()
+            with engine.connect() as conn:
+                # Read-only mappings; callers only look columns up by name
+                return conn.execute(text(sql), params or {}).mappings().all()
+        except SQLAlchemyError as e:
+            raise RuntimeError(f"Database query failed: {str(e)}")
+
+    def execute_internal_rows(
+        self, sql: str, params: Optional[Dict[str, Any]] = None
+    ) -> Sequence[Sequence[Any]]:
+        """Like execute_internal, but return rows as tuples for positional unpacking."""
+        try:
+            engine = self.get_engine()
+            with engine.connect() as conn:
+                return conn.execute(text(sql), params or {}).fetchall()
+        except SQLAlchemyError as e:
+            raise RuntimeError(f"Database query failed: {str(e)}")
+
+    def get_triggers(
+        self, table_name: str, schema_name: Optional[str] = None
+    ) -> List[TriggerInfo]:
+        loader = _TRIGGER_LOADERS.get(self.get_database_type())
+        return loader(self, table_name, schema_name) if loader else []
+
+    def get_schema_triggers(
+        self, schema_name: Optional[str] = None
+    ) -> Dict[str, List[TriggerInfo]]:
+        """Fetch every trigger of a schema in one query, grouped by table."""
+        loader = _TRIGGER_LOADERS.get(self.get_database_type())
+        triggers_by_table: Dict[str, List[TriggerInfo]] = {}
+        for trigger in loader(self, None, schema_name) if loader else []:
+            triggers_by_table.setdefault(trigger.table_name, []).append(trigger)
+        return triggers_by_table
+
+    def get_stored_procedures(
+        self, schema_name: Optional[str] = None
+    ) -> List[StoredProcedureInfo]:
+        loader = _ROUTINE_LOADERS.get(self.get_database_type())
+        return loader(self, schema_name) if loader else []
+
+    def count_stored_procedures(self, schema_name: Optional[str] = None) -> int:
+        """Number of routines, without transferring their definitions."""
+        counter = _ROUTINE_COUNTERS.get(self.get_database_type())
+        if counter is None:
+            return 0
+        try:
+            return counter(self, schema_name)
+        except Exception:
+            # e.g. catalogs without pg_proc.prokind; count the full listing
+            return len(self.get_stored_procedures(schema_name))
+
+    def supports_parallel_reflection(self) -> bool:
+        # SQLite has no network round trips to overlap, and an in-memory
+        # database is only visible to the thread that opened it.
+        return self.get_database_type() != DatabaseType.SQLITE
+
     def get_database_type(self) -> DatabaseType:
-        engine = self.get_engine()
-        dialect_name = engine.dialect.name.lower()
+        if self._database_type is None:
+            dialect_name = self.get_engine().dialect.name.lower()
+            self._database_type = _DIALECT_MAP.get(
+                dialect_name, DatabaseType.POSTGRESQL
+            )
+        return self._database_type
+
+
+_MAX_WORKERS = 8
+
+# Catalog schemas of the supported backends, never part of the overview
+_SYSTEM_SCHEMAS = frozenset(
+    {
+        "information_schema",
+        "INFORMATION_SCHEMA",
+        "pg_catalog",
+        "pg_toast",
+        "mysql",
+        "performance_schema",
+        "sys",
+    }
+)
+
+# Overviews are reused for this many seconds before the catalog is queried again
+_OVERVIEW_TTL_SECONDS = 60.0
+_OVERVIEW_CACHE: Dict[str, tuple[float, DatabaseOverview]] = {}
 
-        mapping = {
-            "postgresql": DatabaseType.POSTGRESQL,
-            "mysql": DatabaseType.MYSQL,
-            "sqlite": DatabaseType.SQLITE,
-            "mssql": DatabaseType.SQLSERVER,
-            "oracle": DatabaseType.ORACLE,
-        }
 
-        return mapping.get(dialect_name, DatabaseType.POSTGRESQL)
+# (schema entry, tables, views, routines, triggers, indexes) for one schema
+_SchemaSummary = tuple[Optional[SchemaInfo], int, int, int, int, int]
 
 
-def get_database_overview_tool(connection_string: str) -> DatabaseOverview:
+def get_database_overview_tool(
+    connection_string: str, max_workers: int = _MAX_WORKERS
+) -> DatabaseOverview:
+    cached = _get_cached_overview(connection_string)
+    if cached is not None:
+        return cached
+
+    overview = _build_database_overview(connection_string, max_workers)
+    _cache_overview(connection_string, overview)
+    return overview
+
+
+def invalidate_overview_cache(connection_string: Optional[str] = None) -> None:
+    """Drop the cached overview for one connection string, or all of them."""
+    if connection_string is None:
+        _OVERVIEW_CACHE.clear()
+    else:
+        _OVERVIEW_CACHE.pop(connection_string, None)
+
+
+# The cache keeps a private copy and hands out fresh deep copies, so a caller
+# mutating its overview can't change what later callers get
+
+
+def _get_cached_overview(connection_string: str) -> Optional[DatabaseOverview]:
+    cached = _OVERVIEW_CACHE.get(connection_string)
+    if cached and time.monotonic() - cached[0] < _OVERVIEW_TTL_SECONDS:
+        return cached[1].model_copy(deep=True)
+    return None
+
+
+def _cache_overview(connection_string: str, overview: DatabaseOverview) -> None:
+    _OVERVIEW_CACHE[connection_string] = (
+        time.monotonic(),
+        overview.model_copy(deep=True),
+    )
+
+
+def _build_database_overview(
+    connection_string: str, max_workers: int = _MAX_WORKERS
+) -> DatabaseOverview:
     connector = DatabaseConnector(connection_string)
-    engine = connector.get_engine()
-    inspector = inspect(engine)
+    schema_names = _overview_schema_names(connector)
 
-    db_type = connector.get_database_type()
-    schema_names = inspector.get_schema_names() or ["public"]
+    def summarize(schema_name: str) -> _SchemaSummary:
+        return _summarize_schema(connector, schema_name)
 
+    # Schemas are independent, so overlap their catalog round trips
+    if connector.supports_parallel_reflection() and len(schema_names) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(schema_names))
+        ) as executor:
+            summaries = list(executor.map(summarize, schema_names))
+    else:
+        summaries = [summarize(schema_name) for schema_name in schema_names]
+
+    return _assemble_overview(connector, summaries)
+
+
+def _overview_schema_names(connector: DatabaseConnector) -> List[str]:
+    return [
+        schema_name
+        for schema_name in connector.get_inspector().get_schema_names() or ["public"]
+        if schema_name not in _SYSTEM_SCHEMAS
+    ]
+
+
+def _assemble_overview(
+    connector: DatabaseConnector, summaries: List[_SchemaSummary]
+) -> DatabaseOverview:
     schemas = []
     total_tables = 0
     total_views = 0
@@ -158,70 +465,25 @@ def get_database_overview_tool(connection_string: str) -> DatabaseOverview:
     total_triggers = 0
     total_indexes = 0
 
-    for schema_name in schema_names:
-        if schema_name in [
-            "information_schema",
-            "pg_catalog",
-            "mysql",
-            "performance_schema",
-        ]:
-            continue
-
-        table_names = inspector.get_table_names(schema=schema_name)
-        view_names = inspector.get_view_names(schema=schema_name)
-
-        total_tables += len(table_names)
-        total_views += len(view_names)
-
-        # Get stored procedures for this schema
-        stored_procedures = get_stored_procedures_tool(connection_string, schema_name)
-        total_stored_procedures += len(stored_procedures)
-
-        # Count triggers and indexes across all tables in this schema
-        schema_triggers = 0
-        schema_indexes = 0
-        for table_name in table_names:
-            # Get triggers for this table
-            table_triggers = get_triggers_tool(
-                connection_string, table_name, schema_name
-            )
-            schema_triggers += len(table_triggers)
-
-            # Get indexes for this table
-            table_indexes = inspector.get_indexes(table_name, schema=schema_name)
-            schema_indexes += len(table_indexes)
-
-            # Also count primary key as an index if it exists
-            pk_constraint = inspector.get_pk_constraint(table_name, schema=schema_name)
-            if pk_constraint and pk_constraint.get("constrained_columns"):
-                schema_indexes += 1
-
-        total_triggers += schema_triggers
-        total_indexes += schema_indexes
-
-        # Only include schemas that have actual content (tables, views, or procedures)
-        if table_names or view_names or stored_procedures:
-            # Create basic table info objects for the overview
-            basic_tables = [
-                TableInfo(name=table_name, columns=[]) for table_name in table_names
-            ]
-            basic_views = [
-                TableInfo(name=view_name, columns=[]) for view_name in view_names
-            ]
-
-            schemas.append(
-                SchemaInfo(
-                    name=schema_name,
-                    tables=basic_tables,
-                    views=basic_views,
-                    stored_procedures=stored_procedures,
-                    relationships=[],
-                )
-            )
+    for (
+        schema_info,
+        n_tables,
+        n_views,
+        n_procedures,
+        n_triggers,
+        n_indexes,
+    ) in summaries:
+        total_tables += n_tables
+        total_views += n_views
+        total_stored_procedures += n_procedures
+        total_triggers += n_triggers
+        total_indexes += n_indexes
+        if schema_info is not None:
+            schemas.append(schema_info)
 
     return DatabaseOverview(
-        name=engine.url.database or "unknown",
-        database_type=db_type,
+        name=connector.get_engine().url.database or "unknown",
+        database_type=connector.get_database_type(),
         schemas=schemas,
         total_tables=total_tables,
         total_views=total_views,
@@ -231,33 +493,247 @@ def get_database_overview_tool(connection_string: str) -> DatabaseOverview:
     )
 
 
+def _summarize_schema(connector: DatabaseConnector, schema_name: str) -> _SchemaSummary:
+    """Collect one schema's overview entry and its object counts."""
+    inspector = connector.get_inspector()
+    table_names = inspector.get_table_names(schema=schema_name)
+    view_names = inspector.get_view_names(schema=schema_name)
+
+    # Only the number of routines; their definitions are fetched by the
+    # per-schema detail path (DBSpelunker.analyze_schema)
+    n_procedures = connector.count_stored_procedures(schema_name)
+
+    schema_triggers, schema_indexes = _count_triggers_and_indexes(
+        connector, schema_name, table_names
+    )
+
+    schema_info = None
+    # Only include schemas that have actual content (tables, views, or procedures)
+    if table_names or view_names or n_procedures:
+        # Create basic table info objects for the overview
+        basic_tables = [
+            TableInfo(name=table_name, columns=[]) for table_name in table_names
+        ]
+        basic_views = [
+            TableInfo(name=view_name, columns=[]) for view_name in view_names
+        ]
+
+        schema_info = SchemaInfo(
+            name=schema_name,
+            tables=basic_tables,
+            views=basic_views,
+            relationships=[],
+        )
+
+    return (
+        schema_info,
+        len(table_names),
+        len(view_names),
+        n_procedures,
+        schema_triggers,
+        schema_indexes,
+    )
+
+
+def _count_triggers_and_indexes(
+    connector: DatabaseConnector, schema_name: str, table_names: List[str]
+) -> tuple[int, int]:
+    if not table_names:
+        return 0, 0
+
+    if connector.get_database_type() == DatabaseType.POSTGRESQL:
+        try:
+            return _get_postgresql_overview_counts(connector, schema_name)
+        except Exception:
+            pass  # Fall back to reflection below
+
+    inspector = connector.get_inspector()
+
+    # Count triggers across all tables in this schema with a single query
+    triggers_by_table = connector.get_schema_triggers(schema_name)
+    schema_triggers = sum(
+        len(triggers_by_table.get(table_name, [])) for table_name in table_names
+    )
+
+    # Count indexes across all tables in this schema, one batch call each for
+    # indexes and primary keys instead of two round trips per table
+    indexes_by_table = inspector.get_multi_indexes(schema=schema_name)
+    schema_indexes = sum(map(len, indexes_by_table.values()))
+
+    # Also count primary key as an index if it exists
+    pks_by_table = inspector.get_multi_pk_constraint(schema=schema_name)
+    schema_indexes += sum(
+        1 for pk in pks_by_table.values() if pk and pk.get("constrained_columns")
+    )
+
+    return schema_triggers, schema_indexes
+
+
+def _get_postgresql_overview_counts(
+    connector: DatabaseConnector, schema_name: str
+) -> tuple[int, int]:
+    """Trigger and index counts for a schema's tables in one round trip."""
+    sql = """
+    SELECT 'triggers' as kind, count(*) as total
+    FROM pg_trigger t
+    JOIN pg_class c ON t.tgrelid = c.oid
+    JOIN pg_namespace n ON c.relnamespace = n.oid
+    WHERE NOT t.tgisinternal
+    AND c.relkind IN ('r', 'p')
+    AND n.nspname = :schema_name
+    UNION ALL
+    SELECT 'indexes' as kind, count(*) as total
+    FROM pg_index i
+    JOIN pg_class c ON i.indrelid = c.oid
+    JOIN pg_namespace n ON c.relnamespace = n.oid
+    WHERE c.relkind IN ('r', 'p')
+    AND n.nspname = :schema_name
+    """
+    counts: Dict[str, int] = {
+        kind: int(total)
+        for kind, total in connector.execute_internal_rows(
+            sql, {"schema_name": schema_name}
+        )
+    }
+    return counts["triggers"], counts["indexes"]
+
+
 def get_table_schema_tool(
-    connection_string: str, table_name: str, schema_name: Optional[str] = None
+    connection_string: str,
+    table_name: str,
+    schema_name: Optional[str] = None,
+    include_triggers: bool = False,
+    connector: Optional[DatabaseConnector] = None,
+    triggers: Optional[List[TriggerInfo]] = None,
 ) -> TableInfo:
-    connector = DatabaseConnector(connection_string)
-    engine = connector.get_engine()
-    inspector = inspect(engine)
+    """
+    Describe one table. Pass triggers when they were already fetched (e.g. from
+    DatabaseConnector.get_schema_triggers) to skip the per-table trigger query.
+    """
+    connector = connector or DatabaseConnector(connection_string)
+    inspector = connector.get_inspector()
 
-    columns_data = inspector.get_columns(table_name, schema=schema_name)
-    pk_constraint = inspector.get_pk_constraint(table_name, schema=schema_name)
-    foreign_keys = inspector.get_foreign_keys(table_name, schema=schema_name)
-    indexes = inspector.get_indexes(table_name, schema=schema_name)
-
-    pk_columns = set(pk_constraint.get("constrained_columns", []))
-    fk_map = {
-        fk["constrained_columns"][0]: (fk["referred_table"], fk["referred_columns"][0])
-        for fk in foreign_keys
-        if fk["constrained_columns"]
-    }
+    # Triggers cost an extra catalog query, so only callers that render them
+    # pay for it, and never twice
+    if triggers is None and not include_triggers:
+        triggers = []
+
+    # Sequential on purpose: several of these calls may already run side by
+    # side, and batches of tables should go through get_tables_schema_tool
+    return _build_table_info(
+        connector,
+        table_name,
+        schema_name,
+        inspector.get_columns(table_name, schema=schema_name),
+        inspector.get_pk_constraint(table_name, schema=schema_name),
+        inspector.get_foreign_keys(table_name, schema=schema_name),
+        inspector.get_indexes(table_name, schema=schema_name),
+        connector.get_triggers(table_name, schema_name)
+        if triggers is None
+        else triggers,
+        _get_table_stats(connector, table_name, schema_name),
+    )
+
+
+def get_tables_schema_tool(
+    connection_string: str,
+    schema_name: Optional[str] = None,
+    table_names: Optional[List[str]] = None,
+    include_triggers: bool = False,
+    connector: Optional[DatabaseConnector] = None,
+    exact_row_counts: bool = False,
+    max_workers: int = _MAX_WORKERS,
+) -> List[TableInfo]:
+    """
+    Describe many tables at once using SQLAlchemy's batch reflection.
+
+    Row counts and sizes come from the catalog's estimates in a single query;
+    pass exact_row_counts=True to run a COUNT(*) per table instead. At most
+    max_workers tables have their remaining per-table queries in flight.
+    """
+    connector = connector or DatabaseConnector(connection_string)
+    inspector = connector.get_inspector()
+
+    if table_names is None:
+        table_names = inspector.get_table_names(schema=schema_name)
+    if not table_names:
+        return []
+
+    reflection = connector.reflect_schema(schema_name)
+    # One trigger query for the whole schema rather than one per table
+    triggers_by_table = (
+        connector.get_schema_triggers(schema_name) if include_triggers else {}
+    )
+    stats_by_table = (
+        {} if exact_row_counts else _get_schema_table_stats(connector, schema_name)
+    )
+
+    def describe(table_name: str) -> TableInfo:
+        key = (schema_name, table_name)
+        return _build_table_info(
+            connector,
+            table_name,
+            schema_name,
+            reflection.columns.get(key, []),
+            reflection.pk_constraints.get(
+                key, {"name": None, "constrained_columns": []}
+            ),
+            reflection.foreign_keys.get(key, []),
+            reflection.indexes.get(key, []),
+            triggers_by_table.get(table_name, []),
+            _get_table_stats(connector, table_name, schema_name)
+            if exact_row_counts
+            else stats_by_table.get(table_name, (None, None)),
+        )
+
+    # Each table still needs its own constraint, trigger and statistics
+    # queries; overlap them the same way the overview overlaps schemas
+    if connector.supports_parallel_reflection() and len(table_names) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(table_names))
+        ) as executor:
+            return list(executor.map(describe, table_names))
+    return [describe(table_name) for table_name in table_names]
+
+
+# fk_map default for columns that reference nothing
+_NO_FK: tuple[None, None] = (None, None)
+
+
+def _build_table_info(
+    connector: DatabaseConnector,
+    table_name: str,
+    schema_name: Optional[str],
+    columns_data: List[ReflectedColumn],
+    pk_constraint: ReflectedPrimaryKeyConstraint,
+    foreign_keys: List[ReflectedForeignKeyConstraint],
+    indexes: List[ReflectedIndex],
+    triggers: List[TriggerInfo],
+    stats: tuple[Optional[int], Optional[int]],
+) -> TableInfo:
+    pk_columns = frozenset(pk_constraint.get("constrained_columns", []))
+    is_postgresql = connector.get_database_type() == DatabaseType.POSTGRESQL
+
+    # Single pass over the reflected FKs: map every constrained column to the
+    # column it references and, outside PostgreSQL (which has its own query for
+    # referential actions), build the FK constraints from the same data.
+    fk_map: Dict[str, tuple[str, str]] = {}
+    fk_constraints: List[ConstraintInfo] = []
+    for fk in foreign_keys:
+        for col, ref_col in zip(fk["constrained_columns"], fk["referred_columns"]):
+            fk_map[col] = (fk["referred_table"], ref_col)
+        if not is_postgresql:
+            fk_constraints.append(_fk_constraint_info(table_name, fk))
 
     columns = []
     for col_data in columns_data:
         col_name = col_data["name"]
         type_str = str(col_data["type"])
         data_type, max_length, precision, scale = _extract_type_info(type_str)
+        fk_table, fk_column = fk_map.get(col_name, _NO_FK)
 
         columns.append(
-            ColumnInfo(
+            ColumnInfo.from_catalog(
                 name=col_name,
                 data_type=data_type,
                 max_length=max_length,
@@ -268,16 +744,16 @@ def get_table_schema_tool(
                 if col_data["default"] is not None
                 else None,
                 is_primary_key=col_name in pk_columns,
-                is_foreign_key=col_name in fk_map,
-                foreign_key_table=fk_map.get(col_name, (None, None))[0],
-                foreign_key_column=fk_map.get(col_name, (None, None))[1],
+                is_foreign_key=fk_table is not None,
+                foreign_key_table=fk_table,
+                foreign_key_column=fk_column,
             )
         )
 
     constraints = []
     if pk_constraint["constrained_columns"]:
         constraints.append(
-            ConstraintInfo(
+            ConstraintInfo.from_catalog(
                 name=pk_constraint["name"] or f"{table_name}_pkey",
                 type=ConstraintType.PRIMARY_KEY,
                 columns=pk_constraint["constrained_columns"],
@@ -285,9 +761,10 @@ def get_table_schema_tool(
         )
 
     # Get foreign key constraints with proper ON DELETE/UPDATE info
-    fk_constraints = get_foreign_key_constraints_tool(
-        connector, table_name, schema_name
-    )
+    if is_postgresql:
+        fk_constraints = _get_postgresql_foreign_key_constraints(
+            connector, table_name, schema_name
+        )
     constraints.extend(fk_constraints)
 
     # Add CHECK constraints
@@ -298,26 +775,28 @@ def get_table_schema_tool(
     unique_constraints = get_unique_constraints_tool(connector, table_name, schema_name)
     constraints.extend(unique_constraints)
 
+    # Cheap length test first; only same-sized indexes need a set comparison
+    pk_len = len(pk_columns)
     index_info: List[IndexInfo] = []
     for idx in indexes:
         # Check if this index is the primary key index
-        idx_columns = [col for col in idx["column_names"] if col is not None]
+        idx_columns = list(filter(None, idx["column_names"]))
         is_primary_key_index = (
             idx["unique"]
+            and len(idx_columns) == pk_len
             and set(idx_columns) == pk_columns
-            and len(idx_columns) == len(pk_columns)
         )
 
         index_info.append(
-            IndexInfo(
+            IndexInfo.from_catalog(
                 name=idx["name"] or f"{table_name}_idx_{len(index_info)}",
                 table_name=table_name,
                 index_type=IndexType.PRIMARY
                 if is_primary_key_index
                 else (IndexType.UNIQUE if idx["unique"] else IndexType.INDEX),
                 columns=idx_columns,
-                is_unique=idx["unique"],
-                is_primary=is_primary_key_index,
+                is_unique=bool(idx["unique"]),
+                is_primary=bool(is_primary_key_index),
             )
         )
 
@@ -325,7 +804,7 @@ def get_table_schema_tool(
     has_pk_index = any(idx.is_primary for idx in index_info)
     if pk_columns and not has_pk_index:
         index_info.append(
-            IndexInfo(
+            IndexInfo.from_catalog(
                 name=pk_constraint["name"] or f"{table_name}_pkey",
                 table_name=table_name,
                 index_type=IndexType.PRIMARY,
@@ -337,44 +816,73 @@ def get_table_schema_tool(
             )
         )
 
-    # Get row count and size information
+    return TableInfo(
+        name=table_name,
+        schema_name=schema_name,
+        columns=columns,
+        constraints=constraints,
+        indexes=index_info,
+        triggers=triggers,
+        row_count=stats[0],
+        size_bytes=stats[1],
+    )
+
+
+def _get_table_stats(
+    connector: DatabaseConnector, table_name: str, schema_name: Optional[str]
+) -> tuple[Optional[int], Optional[int]]:
+    """Exact row count and total size of one table, where the backend has them."""
     row_count = None
     size_bytes = None
 
     try:
         db_type = connector.get_database_type()
 
+        # These are our own queries, so they skip the read-only validator.
+        # Identifiers can't be bound, so quote them; every value is a parameter
+        full_table_name = _qualified_table_name(connector, table_name, schema_name)
+        params = {"table_name": table_name, "schema_name": schema_name}
+
         if db_type == DatabaseType.POSTGRESQL:
             # Get row count and size for PostgreSQL
             try:
-                # Use actual COUNT(*) for accurate row count
-                full_table_name = (
-                    f'"{schema_name}"."{table_name}"'
-                    if schema_name
-                    else f'"{table_name}"'
-                )
-                count_query = f"SELECT COUNT(*) as row_count FROM {full_table_name}"
-                count_result = connector.execute_safe_sql(count_query)
-                if count_result and count_result[0]["row_count"] is not None:
-                    row_count = int(count_result[0]["row_count"])
-
-                # Try to get table size
-                size_query = (
-                    f"SELECT pg_total_relation_size('{full_table_name}') as size_bytes"
+                # Use actual COUNT(*) for accurate row count, and the size in the
+                # same round trip
+                stats_query = f"""
+                    SELECT
+                        (SELECT COUNT(*) FROM {full_table_name}) as row_count,
+                        pg_total_relation_size(CAST(:relation AS regclass)) as size_bytes
+                """
+                stats_result = connector.execute_internal(
+                    stats_query, {"relation": full_table_name}
                 )
-                size_result = connector.execute_safe_sql(size_query)
-                if size_result and size_result[0]["size_bytes"] is not None:
-                    size_bytes = int(size_result[0]["size_bytes"])
+                if stats_result:
+                    stats = stats_result[0]
+                    if stats["row_count"] is not None:
+                        row_count = int(stats["row_count"])
+                    if stats["size_bytes"] is not None:
+                        size_bytes = int(stats["size_bytes"])
 
             except Exception:
                 # Fallback to estimate if COUNT(*) fails (e.g., on very large tables)
                 try:
-                    estimate_query = f"SELECT reltuples::bigint as row_count FROM pg_class WHERE relname = '{table_name}'"
-                    estimate_result = connector.execute_safe_sql(estimate_query)
-                    if estimate_result and estimate_result[0]["row_count"] is not None:
-                        row_count = max(
-                            0, int(estimate_result[0]["row_count"])
-                        )  # Ensure non-negative
+                    estimate_query = """
+                        SELECT
+                            c.reltuples::bigint as row_count,
+                            pg_total_relation_size(c.oid) as size_bytes
+                        FROM pg_class c
+                        JOIN pg_namespace n ON n.oid = c.relnamespace
+                        WHERE c.relname = :table_name
+                        AND n.nspname = COALESCE(:schema_name, current_schema())
+                    """
+                    estimate_result = connector.execute_internal(estimate_query, params)
+                    if estimate_result:
+                        estimate = estimate_result[0]
+                        if estimate["row_count"] is not None:
+                            # Ensure non-negative
+                            row_count = max(0, int(estimate["row_count"]))
+                        if estimate["size_bytes"] is not None:
+                            size_bytes = int(estimate["size_bytes"])
                 except Exception:
                     pass
 
@@ -382,37 +890,32 @@ def get_table_schema_tool(
             # Get row count and size for MySQL
             try:
                 # Use actual COUNT(*) for accurate row count
-                full_table_name = (
-                    f"`{schema_name}`.`{table_name}`"
-                    if schema_name
-                    else f"`{table_name}`"
-                )
                 count_query = f"SELECT COUNT(*) as row_count FROM {full_table_name}"
-                count_result = connector.execute_safe_sql(count_query)
+                count_result = connector.execute_internal(count_query)
                 if count_result and count_result[0]["row_count"] is not None:
                     row_count = int(count_result[0]["row_count"])
 
                 # Get table size from information_schema
-                size_query = f"""
-                    SELECT 
+                size_query = """
+                    SELECT
                         data_length + index_length as size_bytes
                     FROM information_schema.tables
-                    WHERE table_name = '{table_name}' 
-                    AND table_schema = '{schema_name or "DATABASE()"}'
+                    WHERE table_name = :table_name
+                    AND table_schema = COALESCE(:schema_name, DATABASE())
                 """
-                size_result = connector.execute_safe_sql(size_query)
+                size_result = connector.execute_internal(size_query, params)
                 if size_result and size_result[0]["size_bytes"] is not None:
                     size_bytes = int(size_result[0]["size_bytes"])
             except Exception:
                 # Fallback to information_schema estimate
                 try:
-                    estimate_query = f"""
+                    estimate_query = """
                         SELECT table_rows as row_count
                         FROM information_schema.tables
-                        WHERE table_name = '{table_name}' 
-                        AND table_schema = '{schema_name or "DATABASE()"}'
+                        WHERE table_name = :table_name
+                        AND table_schema = COALESCE(:schema_name, DATABASE())
                     """
-                    estimate_result = connector.execute_safe_sql(estimate_query)
+                    estimate_result = connector.execute_internal(estimate_query, params)
                     if estimate_result and estimate_result[0]["row_count"] is not None:
                         row_count = max(0, int(estimate_result[0]["row_count"]))
                 except Exception:
@@ -421,58 +924,185 @@ def get_table_schema_tool(
     except Exception:
         pass  # Size and row count are optional
 
-    return TableInfo(
-        name=table_name,
-        schema_name=schema_name,
-        columns=columns,
-        constraints=constraints,
-        indexes=index_info,
-        triggers=get_triggers_tool(connection_string, table_name, schema_name),
-        row_count=row_count,
-        size_bytes=size_bytes,
-    )
+    return row_count, size_bytes
+
+
+def _get_schema_table_stats(
+    connector: DatabaseConnector, schema_name: Optional[str]
+) -> Dict[str, tuple[Optional[int], Optional[int]]]:
+    """
+    Estimated row count and total size of every table in a schema, read from the
+    catalog in one query instead of a COUNT(*) per table.
+    """
+    db_type = connector.get_database_type()
+    if db_type == DatabaseType.POSTGRESQL:
+        sql = """
+        SELECT
+            c.relname,
+            c.reltuples::bigint as row_count,
+            pg_total_relation_size(c.oid) as size_bytes
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE c.relkind IN ('r', 'p')
+        AND n.nspname = COALESCE(:schema_name, current_schema())
+        """
+    elif db_type == DatabaseType.MYSQL:
+        sql = """
+        SELECT
+            table_name,
+            table_rows as row_count,
+            data_length + index_length as size_bytes
+        FROM information_schema.tables
+        WHERE table_type = 'BASE TABLE'
+        AND table_schema = COALESCE(:schema_name, DATABASE())
+        """
+    else:
+        return {}
+
+    try:
+        rows = connector.execute_internal_rows(sql, {"schema_name": schema_name})
+    except Exception:
+        return {}  # Size and row count are optional
+
+    return {
+        table_name: (
+            # PostgreSQL reports -1 for tables that were never analyzed
+            int(row_count) if row_count is not None and row_count >= 0 else None,
+            int(size_bytes) if size_bytes is not None else None,
+        )
+        for table_name, row_count, size_bytes in rows
+    }
+
+
+def _qualified_table_name(
+    connector: DatabaseConnector, table_name: str, schema_name: Optional[str]
+) -> str:
+    preparer = connector.get_engine().dialect.identifier_preparer
+    if schema_name:
+        return f"{preparer.quote_schema(schema_name)}.{preparer.quote(table_name)}"
+    return preparer.quote(table_name)
 
 
 def analyze_relationships_tool(
-    connection_string: str, schema_name: Optional[str] = None
+    connection_string: str,
+    schema_name: Optional[str] = None,
+    connector: Optional[DatabaseConnector] = None,
 ) -> List[RelationshipInfo]:
     """Analyze foreign key relationships between tables."""
-    connector = DatabaseConnector(connection_string)
+    connector = connector or DatabaseConnector(connection_string)
     db_type = connector.get_database_type()
 
     if db_type == DatabaseType.POSTGRESQL:
         return _get_postgresql_relationships(connector, schema_name)
+    elif db_type == DatabaseType.MYSQL:
+        return _get_mysql_relationships(connector, schema_name)
     else:
         # Fallback to SQLAlchemy inspector for other databases
-        engine = connector.get_engine()
-        inspector = inspect(engine)
+        return _get_inspector_relationships(connector, schema_name)
 
-        relationships = []
-        table_names = inspector.get_table_names(schema=schema_name)
 
-        for table_name in table_names:
-            foreign_keys = inspector.get_foreign_keys(table_name, schema=schema_name)
+def _get_inspector_relationships(
+    connector: DatabaseConnector, schema_name: Optional[str]
+) -> List[RelationshipInfo]:
+    inspector = connector.get_inspector()
 
-            for fk in foreign_keys:
-                if fk["constrained_columns"] and fk["referred_columns"]:
-                    relationships.append(
-                        RelationshipInfo(
-                            source_table=table_name,
-                            source_column=fk["constrained_columns"][0],
-                            target_table=fk["referred_table"],
-                            target_column=fk["referred_columns"][0],
-                            constraint_name=fk["name"] or f"{table_name}_fk",
-                            on_delete=str(fk.get("ondelete"))
-                            if fk.get("ondelete")
-                            else None,
-                            on_update=str(fk.get("onupdate"))
-                            if fk.get("onupdate")
-                            else None,
-                            relationship_type=RelationshipType.MANY_TO_ONE,  # Default for non-PostgreSQL
-                        )
+    relationships = []
+    # One batch reflection call instead of a round trip per table
+    foreign_keys_by_table = inspector.get_multi_foreign_keys(schema=schema_name)
+
+    for (_, table_name), foreign_keys in foreign_keys_by_table.items():
+        for fk in foreign_keys:
+            if fk["constrained_columns"] and fk["referred_columns"]:
+                relationships.append(
+                    RelationshipInfo(
+                        source_table=table_name,
+                        source_column=fk["constrained_columns"][0],
+                        target_table=fk["referred_table"],
+                        target_column=fk["referred_columns"][0],
+                        constraint_name=fk["name"] or f"{table_name}_fk",
+                        on_delete=str(fk.get("ondelete"))
+                        if fk.get("ondelete")
+                        else None,
+                        on_update=str(fk.get("onupdate"))
+                        if fk.get("onupdate")
+                        else None,
+                        relationship_type=RelationshipType.MANY_TO_ONE,  # Default for non-PostgreSQL
                     )
+                )
 
-        return relationships
+    return relationships
+
+
+# InnoDB treats RESTRICT and NO ACTION alike and, depending on the server
+# version, reports either for a foreign key without an ON DELETE/ON UPDATE
+# clause. The inspector (SHOW CREATE TABLE) gives no action for such keys, so
+# neither rule is reported as one.
+_MYSQL_DEFAULT_FK_RULES = frozenset({"RESTRICT", "NO ACTION"})
+
+
+def _get_mysql_relationships(
+    connector: DatabaseConnector, schema_name: Optional[str]
+) -> List[RelationshipInfo]:
+    """Get every foreign key of a MySQL schema in one catalog query."""
+    schema_filter = (
+        "AND kcu.table_schema = :schema_name"
+        if schema_name
+        else "AND kcu.table_schema = DATABASE()"
+    )
+    # Relationships are keyed on the first column of each (possibly composite) FK
+    sql = f"""
+    SELECT
+        kcu.constraint_name,
+        kcu.table_name,
+        kcu.column_name,
+        kcu.referenced_table_name,
+        kcu.referenced_column_name,
+        rc.delete_rule,
+        rc.update_rule
+    FROM information_schema.key_column_usage kcu
+    JOIN information_schema.referential_constraints rc
+        ON rc.constraint_schema = kcu.constraint_schema
+        AND rc.constraint_name = kcu.constraint_name
+        AND rc.table_name = kcu.table_name
+    WHERE kcu.referenced_table_name IS NOT NULL
+    AND kcu.ordinal_position = 1
+    {schema_filter}
+    ORDER BY kcu.table_name, kcu.constraint_name
+    """
+
+    try:
+        rows = connector.execute_internal_rows(sql, {"schema_name": schema_name})
+    except Exception:
+        return _get_inspector_relationships(connector, schema_name)
+
+    relationships = []
+    for (
+        constraint_name,
+        source_table,
+        source_column,
+        target_table,
+        target_column,
+        delete_rule,
+        update_rule,
+    ) in rows:
+        relationships.append(
+            RelationshipInfo(
+                source_table=source_table,
+                source_column=source_column,
+                target_table=target_table,
+                target_column=target_column,
+                constraint_name=constraint_name,
+                on_delete=delete_rule
+                if delete_rule not in _MYSQL_DEFAULT_FK_RULES
+                else None,
+                on_update=update_rule
+                if update_rule not in _MYSQL_DEFAULT_FK_RULES
+                else None,
+                relationship_type=RelationshipType.MANY_TO_ONE,  # Default for non-PostgreSQL
+            )
+        )
+
+    return relationships
 
 
 def _get_unique_constraints_postgresql(
@@ -483,7 +1113,7 @@ def _get_unique_constraints_postgresql(
     Returns:
         Dict mapping table_name to list of unique columns
     """
-    schema_filter = f"AND n.nspname = '{schema_name}'" if schema_name else ""
+    schema_filter = "AND n.nspname = :schema_name" if schema_name else ""
     sql = f"""
     SELECT 
         tc.table_name,
@@ -498,36 +1128,34 @@ def _get_unique_constraints_postgresql(
     ORDER BY tc.table_name, kcu.ordinal_position
     """
     try:
-        results = connector.execute_safe_sql(sql)
+        results = connector.execute_internal(sql, {"schema_name": schema_name})
         unique_constraints: Dict[str, List[str]] = {}
         for row in results:
-            table_name = row["table_name"]
-            column_name = row["column_name"]
-            if table_name not in unique_constraints:
-                unique_constraints[table_name] = []
-            unique_constraints[table_name].append(column_name)
+            unique_constraints.setdefault(row["table_name"], []).append(
+                row["column_name"]
+            )
         return unique_constraints
     except Exception:
         return {}
 
 
-def _is_junction_table(table_name: str, relationships: List[RelationshipInfo]) -> bool:
-    """Detect if a table is a junction table for many-to-many relationships.
+def _junction_tables(relationships: List[RelationshipInfo]) -> FrozenSet[str]:
+    """Detect the junction tables of many-to-many relationships in one pass.
 
     A table is considered a junction table if:
     - It has exactly 2 foreign key relationships as source
     - Both foreign keys reference different tables
     - The table has no other significant columns (optional)
     """
-    outgoing_fks = [r for r in relationships if r.source_table == table_name]
-
-    # Must have exactly 2 outgoing foreign keys
-    if len(outgoing_fks) != 2:
-        return False
+    targets_by_source: Dict[str, List[str]] = {}
+    for rel in relationships:
+        targets_by_source.setdefault(rel.source_table, []).append(rel.target_table)
 
-    # Must reference different target tables
-    target_tables = {fk.target_table for fk in outgoing_fks}
-    return len(target_tables) == 2
+    return frozenset(
+        table
+        for table, targets in targets_by_source.items()
+        if len(targets) == 2 and targets[0] != targets[1]
+    )
 
 
 def _detect_relationship_type(
@@ -536,7 +1164,7 @@ def _detect_relationship_type(
     target_table: str,
     target_column: str,
     unique_constraints: Dict[str, List[str]],
-    all_relationships: List[RelationshipInfo],
+    junction_tables: FrozenSet[str],
 ) -> RelationshipType:
     """Detect the relationship type based on constraints and table structure.
 
@@ -547,7 +1175,7 @@ def _detect_relationship_type(
     - ONE_TO_MANY: Reverse perspective of MANY_TO_ONE
     """
     # Check if source table is a junction table
-    if _is_junction_table(source_table, all_relationships):
+    if source_table in junction_tables:
         return RelationshipType.MANY_TO_MANY
 
     # Check if source column has unique constraint
@@ -565,7 +1193,7 @@ def _get_postgresql_relationships(
     connector: DatabaseConnector, schema_name: Optional[str] = None
 ) -> List[RelationshipInfo]:
     """Get foreign key relationships for PostgreSQL with proper ON DELETE/UPDATE detection."""
-    schema_filter = f"AND n.nspname = '{schema_name}'" if schema_name else ""
+    schema_filter = "AND n.nspname = :schema_name" if schema_name else ""
 
     sql = f"""
     SELECT 
@@ -593,7 +1221,7 @@ def _get_postgresql_relationships(
     """
 
     try:
-        results = connector.execute_safe_sql(sql)
+        results = connector.execute_internal(sql, {"schema_name": schema_name})
 
         # Get unique constraints for relationship type detection
         unique_constraints = _get_unique_constraints_postgresql(connector, schema_name)
@@ -624,6 +1252,7 @@ def _get_postgresql_relationships(
             )
 
         # Second pass: detect actual relationship types
+        junction_tables = _junction_tables(basic_relationships)
         final_relationships = []
         for rel in basic_relationships:
             relationship_type = _detect_relationship_type(
@@ -632,7 +1261,7 @@ def _get_postgresql_relationships(
                 rel.target_table,
                 rel.target_column,
                 unique_constraints,
-                basic_relationships,
+                junction_tables,
             )
 
             final_relationships.append(
@@ -651,8 +1280,7 @@ def _get_postgresql_relationships(
         return final_relationships
     except Exception:
         # Fallback to original method if query fails
-        engine = connector.get_engine()
-        inspector = inspect(engine)
+        inspector = connector.get_inspector()
         relationships = []
         table_names = inspector.get_table_names(schema=schema_name)
 
@@ -674,37 +1302,40 @@ def _get_postgresql_relationships(
 
 
 def get_indexes_tool(
-    connection_string: str, table_name: str, schema_name: Optional[str] = None
+    connection_string: str,
+    table_name: str,
+    schema_name: Optional[str] = None,
+    connector: Optional[DatabaseConnector] = None,
 ) -> List[IndexInfo]:
     """Get detailed index information for a table."""
-    connector = DatabaseConnector(connection_string)
-    engine = connector.get_engine()
-    inspector = inspect(engine)
+    connector = connector or DatabaseConnector(connection_string)
+    inspector = connector.get_inspector()
 
     indexes_data = inspector.get_indexes(table_name, schema=schema_name)
     pk_constraint = inspector.get_pk_constraint(table_name, schema=schema_name)
-    pk_columns = set(pk_constraint.get("constrained_columns", []))
+    pk_columns = frozenset(pk_constraint.get("constrained_columns", []))
+    pk_len = len(pk_columns)
 
     indexes: List[IndexInfo] = []
     for idx_data in indexes_data:
         # Check if this index is the primary key index
-        idx_columns = [col for col in idx_data["column_names"] if col is not None]
+        idx_columns = list(filter(None, idx_data["column_names"]))
         is_primary_key_index = (
             idx_data["unique"]
+            and len(idx_columns) == pk_len
             and set(idx_columns) == pk_columns
-            and len(idx_columns) == len(pk_columns)
         )
 
         indexes.append(
-            IndexInfo(
+            IndexInfo.from_catalog(
                 name=idx_data["name"] or f"{table_name}_idx_{len(indexes)}",
                 table_name=table_name,
                 index_type=IndexType.PRIMARY
                 if is_primary_key_index
                 else (IndexType.UNIQUE if idx_data["unique"] else IndexType.INDEX),
                 columns=idx_columns,
-                is_unique=idx_data["unique"],
-                is_primary=is_primary_key_index,
+                is_unique=bool(idx_data["unique"]),
+                is_primary=bool(is_primary_key_index),
             )
         )
 
@@ -712,31 +1343,31 @@ def get_indexes_tool(
 
 
 def get_triggers_tool(
-    connection_string: str, table_name: str, schema_name: Optional[str] = None
+    connection_string: str,
+    table_name: str,
+    schema_name: Optional[str] = None,
+    connector: Optional[DatabaseConnector] = None,
 ) -> List[TriggerInfo]:
-    connector = DatabaseConnector(connection_string)
-    db_type = connector.get_database_type()
-
-    if db_type == DatabaseType.POSTGRESQL:
-        return _get_postgresql_triggers(connector, table_name, schema_name)
-    elif db_type == DatabaseType.MYSQL:
-        return _get_mysql_triggers(connector, table_name, schema_name)
-    else:
-        return []
+    connector = connector or DatabaseConnector(connection_string)
+    return connector.get_triggers(table_name, schema_name)
 
 
 def get_stored_procedures_tool(
-    connection_string: str, schema_name: Optional[str] = None
+    connection_string: str,
+    schema_name: Optional[str] = None,
+    connector: Optional[DatabaseConnector] = None,
 ) -> List[StoredProcedureInfo]:
-    connector = DatabaseConnector(connection_string)
-    db_type = connector.get_database_type()
+    connector = connector or DatabaseConnector(connection_string)
+    return connector.get_stored_procedures(schema_name)
 
-    if db_type == DatabaseType.POSTGRESQL:
-        return _get_postgresql_functions(connector, schema_name)
-    elif db_type == DatabaseType.MYSQL:
-        return _get_mysql_procedures(connector, schema_name)
-    else:
-        return []
+
+def count_stored_procedures_tool(
+    connection_string: str,
+    schema_name: Optional[str] = None,
+    connector: Optional[DatabaseConnector] = None,
+) -> int:
+    connector = connector or DatabaseConnector(connection_string)
+    return connector.count_stored_procedures(schema_name)
 
 
 def get_check_constraints_tool(
@@ -779,31 +1410,45 @@ def get_foreign_key_constraints_tool(
         )
     else:
         # Fallback to SQLAlchemy inspector for other databases
-        engine = connector.get_engine()
-        inspector = inspect(engine)
+        inspector = connector.get_inspector()
         foreign_keys = inspector.get_foreign_keys(table_name, schema=schema_name)
 
-        constraints = []
-        for fk in foreign_keys:
-            constraints.append(
-                ConstraintInfo(
-                    name=fk["name"] or f"{table_name}_fk",
-                    type=ConstraintType.FOREIGN_KEY,
-                    columns=fk["constrained_columns"],
-                    referenced_table=fk["referred_table"],
-                    referenced_columns=fk["referred_columns"],
-                    on_delete=str(fk.get("ondelete")) if fk.get("ondelete") else None,
-                    on_update=str(fk.get("onupdate")) if fk.get("onupdate") else None,
-                )
-            )
-        return constraints
+        return [_fk_constraint_info(table_name, fk) for fk in foreign_keys]
+
+
+def _fk_constraint_info(
+    table_name: str, fk: ReflectedForeignKeyConstraint
+) -> ConstraintInfo:
+    return ConstraintInfo.from_catalog(
+        name=fk["name"] or f"{table_name}_fk",
+        type=ConstraintType.FOREIGN_KEY,
+        columns=fk["constrained_columns"],
+        referenced_table=fk["referred_table"],
+        referenced_columns=fk["referred_columns"],
+        on_delete=str(fk.get("ondelete")) if fk.get("ondelete") else None,
+        on_update=str(fk.get("onupdate")) if fk.get("onupdate") else None,
+    )
+
+
+# Elements of a PostgreSQL array literal such as {col1,"Col 2"}
+_PG_ARRAY_RE = re.compile(r"[^{},]+")
+_PG_ARRAY_BODY_RE = re.compile(r"\{(.*)\}", re.DOTALL)
+
+
+def _parse_pg_array(value: Any) -> List[str]:
+    """Column names from an array column, whether or not the driver decoded it."""
+    if not value:
+        return []
+    if isinstance(value, list):
+        return value
+    return [col.strip('"') for col in _PG_ARRAY_RE.findall(str(value)) if col.strip()]
 
 
 def _get_postgresql_foreign_key_constraints(
     connector: DatabaseConnector, table_name: str, schema_name: Optional[str]
 ) -> List[ConstraintInfo]:
     """Get foreign key constraints for PostgreSQL with proper ON DELETE/UPDATE detection."""
-    schema_filter = f"AND tc.table_schema = '{schema_name}'" if schema_name else ""
+    schema_filter = "AND tc.table_schema = :schema_name" if schema_name else ""
 
     sql = f"""
     SELECT 
@@ -824,14 +1469,16 @@ def _get_postgresql_foreign_key_constraints(
         ON tc.constraint_name = rc.constraint_name
         AND tc.table_schema = rc.constraint_schema
     WHERE tc.constraint_type = 'FOREIGN KEY'
-    AND tc.table_name = '{table_name}'
+    AND tc.table_name = :table_name
     {schema_filter}
     GROUP BY tc.constraint_name, ccu.table_name, rc.delete_rule, rc.update_rule
     ORDER BY tc.constraint_name
     """
 
     try:
-        results = connector.execute_safe_sql(sql)
+        results = connector.execute_internal(
+            sql, {"table_name": table_name, "schema_name": schema_name}
+        )
         constraints = []
 
         for row in results:
@@ -845,34 +1492,11 @@ def _get_postgresql_foreign_key_constraints(
                 on_update = row["on_update"]
 
             # Handle column arrays
-            constrained_columns = []
-            if row["constrained_columns"]:
-                if isinstance(row["constrained_columns"], list):
-                    constrained_columns = row["constrained_columns"]
-                else:
-                    # Parse PostgreSQL array format
-                    import re
-
-                    col_match = re.findall(r"[^{},]+", str(row["constrained_columns"]))
-                    constrained_columns = [
-                        col.strip('"') for col in col_match if col.strip()
-                    ]
-
-            referenced_columns = []
-            if row["referenced_columns"]:
-                if isinstance(row["referenced_columns"], list):
-                    referenced_columns = row["referenced_columns"]
-                else:
-                    # Parse PostgreSQL array format
-                    import re
-
-                    col_match = re.findall(r"[^{},]+", str(row["referenced_columns"]))
-                    referenced_columns = [
-                        col.strip('"') for col in col_match if col.strip()
-                    ]
+            constrained_columns = _parse_pg_array(row["constrained_columns"])
+            referenced_columns = _parse_pg_array(row["referenced_columns"])
 
             constraints.append(
-                ConstraintInfo(
+                ConstraintInfo.from_catalog(
                     name=row["constraint_name"],
                     type=ConstraintType.FOREIGN_KEY,
                     columns=constrained_columns,
@@ -892,7 +1516,7 @@ def _get_postgresql_check_constraints(
     connector: DatabaseConnector, table_name: str, schema_name: Optional[str]
 ) -> List[ConstraintInfo]:
     """Get CHECK constraints for PostgreSQL."""
-    schema_filter = f"AND n.nspname = '{schema_name}'" if schema_name else ""
+    schema_filter = "AND n.nspname = :schema_name" if schema_name else ""
 
     sql = f"""
     SELECT 
@@ -907,14 +1531,16 @@ def _get_postgresql_check_constraints(
     FROM pg_constraint con
     JOIN pg_class c ON con.conrelid = c.oid
     JOIN pg_namespace n ON c.relnamespace = n.oid
-    WHERE c.relname = '{table_name}'
+    WHERE c.relname = :table_name
     AND con.contype = 'c'  -- CHECK constraints
     {schema_filter}
     ORDER BY con.conname
     """
 
     try:
-        results = connector.execute_safe_sql(sql)
+        results = connector.execute_internal(
+            sql, {"table_name": table_name, "schema_name": schema_name}
+        )
         constraints = []
 
         for row in results:
@@ -928,20 +1554,10 @@ def _get_postgresql_check_constraints(
                     check_clause = check_clause[1:-1]
 
             # Handle column names array (PostgreSQL returns arrays as strings)
-            columns = []
-            col_array = row["constrained_columns"]
-            if col_array:
-                if isinstance(col_array, str):
-                    # Parse PostgreSQL array format: {col1,col2}
-                    import re
-
-                    col_match = re.findall(r"[^{},]+", col_array)
-                    columns = [col.strip('"') for col in col_match if col.strip()]
-                elif isinstance(col_array, list):
-                    columns = col_array
+            columns = _parse_pg_array(row["constrained_columns"])
 
             constraints.append(
-                ConstraintInfo(
+                ConstraintInfo.from_catalog(
                     name=row["constraint_name"],
                     type=ConstraintType.CHECK,
                     columns=columns,
@@ -959,7 +1575,7 @@ def _get_mysql_check_constraints(
 ) -> List[ConstraintInfo]:
     """Get CHECK constraints for MySQL."""
     schema_filter = (
-        f"AND table_schema = '{schema_name}'"
+        "AND table_schema = :schema_name"
         if schema_name
         else "AND table_schema = DATABASE()"
     )
@@ -969,18 +1585,20 @@ def _get_mysql_check_constraints(
         constraint_name,
         check_clause
     FROM information_schema.check_constraints
-    WHERE table_name = '{table_name}'
+    WHERE table_name = :table_name
     {schema_filter}
     ORDER BY constraint_name
     """
 
     try:
-        results = connector.execute_safe_sql(sql)
+        results = connector.execute_internal(
+            sql, {"table_name": table_name, "schema_name": schema_name}
+        )
         constraints = []
 
         for row in results:
             constraints.append(
-                ConstraintInfo(
+                ConstraintInfo.from_catalog(
                     name=row["constraint_name"],
                     type=ConstraintType.CHECK,
                     columns=[],  # MySQL doesn't easily provide column info for CHECK constraints
@@ -993,6 +1611,39 @@ def _get_mysql_check_constraints(
         return []
 
 
+# Checked in order with plain substring tests, first match wins: specific
+# names must precede the generic substrings they contain (bigint before int,
+# varchar before char, timestamp before time). For a couple of dozen short
+# needles this beats any single regex pass; _extract_type_info's cache covers
+# the repeats.
+_TYPE_DISPATCH: tuple[tuple[str, ColumnType], ...] = (
+    ("bigint", ColumnType.BIGINT),
+    ("smallint", ColumnType.SMALLINT),
+    ("int", ColumnType.INTEGER),
+    ("varchar", ColumnType.VARCHAR),
+    ("char", ColumnType.CHAR),
+    ("text", ColumnType.TEXT),
+    ("decimal", ColumnType.DECIMAL),
+    ("numeric", ColumnType.DECIMAL),
+    ("float", ColumnType.FLOAT),
+    ("double", ColumnType.FLOAT),
+    ("real", ColumnType.FLOAT),
+    ("bool", ColumnType.BOOLEAN),
+    ("timestamp", ColumnType.TIMESTAMP),
+    ("time", ColumnType.TIME),
+    ("date", ColumnType.DATE),
+    ("json", ColumnType.JSON),
+    ("blob", ColumnType.BLOB),
+    ("binary", ColumnType.BLOB),
+    ("uuid", ColumnType.UUID),
+    ("array", ColumnType.ARRAY),
+)
+
+# Length or precision/scale in parentheses, e.g. VARCHAR(50), DECIMAL(10,2)
+_TYPE_PARAMS_RE = re.compile(r"\(([^)]+)\)")
+
+
+@lru_cache(maxsize=1024)
 def _extract_type_info(
     type_str: str,
 ) -> tuple[ColumnType, Optional[int], Optional[int], Optional[int]]:
@@ -1008,9 +1659,7 @@ def _extract_type_info(
     scale = None
 
     # Extract numeric info from parentheses - handle patterns like VARCHAR(50), DECIMAL(10,2)
-    import re
-
-    params_match = re.search(r"\(([^)]+)\)", type_str)
+    params_match = _TYPE_PARAMS_RE.search(type_str) if "(" in type_str else None
     if params_match:
         params_str = params_match.group(1)
         if "," in params_str:
@@ -1028,40 +1677,12 @@ def _extract_type_info(
             except ValueError:
                 pass
 
-    # Determine the base type
-    if "int" in type_lower:
-        if "bigint" in type_lower:
-            return ColumnType.BIGINT, max_length, precision, scale
-        elif "smallint" in type_lower:
-            return ColumnType.SMALLINT, max_length, precision, scale
-        return ColumnType.INTEGER, max_length, precision, scale
-    elif "varchar" in type_lower:
-        return ColumnType.VARCHAR, max_length, precision, scale
-    elif "char" in type_lower and "varchar" not in type_lower:
-        # Pure CHAR type (not VARCHAR)
-        return ColumnType.CHAR, max_length, precision, scale
-    elif "text" in type_lower:
-        return ColumnType.TEXT, max_length, precision, scale
-    elif any(t in type_lower for t in ["decimal", "numeric"]):
-        return ColumnType.DECIMAL, max_length, precision, scale
-    elif any(t in type_lower for t in ["float", "double", "real"]):
-        return ColumnType.FLOAT, max_length, precision, scale
-    elif any(t in type_lower for t in ["bool", "boolean"]):
-        return ColumnType.BOOLEAN, max_length, precision, scale
-    elif "timestamp" in type_lower:
-        return ColumnType.TIMESTAMP, max_length, precision, scale
-    elif "time" in type_lower:
-        return ColumnType.TIME, max_length, precision, scale
-    elif "date" in type_lower:
-        return ColumnType.DATE, max_length, precision, scale
-    elif "json" in type_lower:
-        return ColumnType.JSON, max_length, precision, scale
-    elif any(t in type_lower for t in ["blob", "binary"]):
-        return ColumnType.BLOB, max_length, precision, scale
-    elif "uuid" in type_lower:
-        return ColumnType.UUID, max_length, precision, scale
-    elif "array" in type_lower:
-        return ColumnType.ARRAY, max_length, precision, scale
+    # Determine the base type from the name alone, so parameters such as the
+    # labels of ENUM('int', 'text') can't be mistaken for the type
+    type_name = type_lower.split("(", 1)[0]
+    for needle, column_type in _TYPE_DISPATCH:
+        if needle in type_name:
+            return column_type, max_length, precision, scale
 
     return ColumnType.OTHER, max_length, precision, scale
 
@@ -1072,16 +1693,24 @@ def _map_column_type(type_str: str) -> ColumnType:
     return data_type
 
 
+@lru_cache(maxsize=32)
+def _lower(value: Optional[str]) -> str:
+    """Lower-case a catalog keyword such as a trigger event; NULL becomes ""."""
+    return value.lower() if value else ""
+
+
+_TRIGGER_EVENT_MAP: Dict[str, TriggerEvent] = {e.value: e for e in TriggerEvent}
+_TRIGGER_TIMING_MAP: Dict[str, TriggerTiming] = {t.value: t for t in TriggerTiming}
+
+
 def _get_postgresql_triggers(
-    connector: DatabaseConnector, table_name: str, schema_name: Optional[str]
+    connector: DatabaseConnector, table_name: Optional[str], schema_name: Optional[str]
 ) -> List[TriggerInfo]:
     # Use a more comprehensive query that gets trigger details from pg_trigger
-    schema_condition = f"AND n.nspname = '{schema_name}'" if schema_name else ""
-    sql = f"""
+    sql = """
     SELECT 
-        t.tgname as trigger_name,
         c.relname as table_name,
-        n.nspname as schema_name,
+        t.tgname as trigger_name,
         p.proname as function_name,
         CASE 
             WHEN t.tgtype & 2 != 0 THEN 'before'
@@ -1107,45 +1736,41 @@ def _get_postgresql_triggers(
     JOIN pg_class c ON t.tgrelid = c.oid
     JOIN pg_namespace n ON c.relnamespace = n.oid
     JOIN pg_proc p ON t.tgfoid = p.oid
-    WHERE c.relname = '{table_name}' 
-    AND NOT t.tgisinternal
-    {schema_condition}
-    ORDER BY t.tgname
+    WHERE NOT t.tgisinternal
+    AND (CAST(:table_name AS text) IS NULL OR c.relname = :table_name)
+    AND (CAST(:schema_name AS text) IS NULL OR n.nspname = :schema_name)
+    ORDER BY c.relname, t.tgname
     """
 
     try:
-        results = connector.execute_safe_sql(sql)
+        rows = connector.execute_internal_rows(
+            sql, {"table_name": table_name, "schema_name": schema_name}
+        )
         triggers = []
 
-        for row in results:
-            # Import the enums at the function level to avoid circular imports
-            from .models import TriggerEvent, TriggerTiming
-
-            # Map event string to enum
-            event_str = row["event"].lower()
-            try:
-                event = TriggerEvent(event_str)
-            except ValueError:
-                # Default to INSERT if we can't map the event
-                event = TriggerEvent.INSERT
-
-            # Map timing string to enum
-            timing_str = row["timing"].lower()
-            try:
-                timing = TriggerTiming(timing_str)
-            except ValueError:
-                # Default to AFTER if we can't map the timing
-                timing = TriggerTiming.AFTER
-
+        for (
+            trigger_table,
+            trigger_name,
+            function_name,
+            timing_str,
+            event_str,
+            is_enabled,
+            definition,
+        ) in rows:
             triggers.append(
                 TriggerInfo(
-                    name=row["trigger_name"],
-                    table_name=table_name,
-                    event=event,
-                    timing=timing,
-                    definition=row["definition"] or "",
-                    is_enabled=row["is_enabled"],
-                    description=f"Trigger function: {row['function_name']}",
+                    name=trigger_name,
+                    table_name=trigger_table,
+                    # Default to INSERT / AFTER if we can't map the catalog value
+                    event=_TRIGGER_EVENT_MAP.get(
+                        _lower(event_str), TriggerEvent.INSERT
+                    ),
+                    timing=_TRIGGER_TIMING_MAP.get(
+                        _lower(timing_str), TriggerTiming.AFTER
+                    ),
+                    definition=definition or "",
+                    is_enabled=is_enabled,
+                    description=f"Trigger function: {function_name}",
                 )
             )
 
@@ -1156,44 +1781,41 @@ def _get_postgresql_triggers(
 
 
 def _get_postgresql_triggers_fallback(
-    connector: DatabaseConnector, table_name: str, schema_name: Optional[str]
+    connector: DatabaseConnector, table_name: Optional[str], schema_name: Optional[str]
 ) -> List[TriggerInfo]:
     """Fallback to information_schema if pg_trigger query fails."""
-    from .models import TriggerEvent, TriggerTiming
-
-    schema_filter = f"AND schemaname = '{schema_name}'" if schema_name else ""
-    sql = f"""
-    SELECT trigger_name, event_manipulation, action_timing, action_statement
-    FROM information_schema.triggers 
-    WHERE table_name = '{table_name}' {schema_filter}
+    sql = """
+    SELECT event_object_table, trigger_name, event_manipulation, action_timing,
+        action_statement
+    FROM information_schema.triggers
+    WHERE (CAST(:table_name AS text) IS NULL OR event_object_table = :table_name)
+    AND (CAST(:schema_name AS text) IS NULL OR event_object_schema = :schema_name)
     """
 
     try:
-        results = connector.execute_safe_sql(sql)
+        rows = connector.execute_internal_rows(
+            sql, {"table_name": table_name, "schema_name": schema_name}
+        )
         triggers = []
 
-        for row in results:
-            # Map event string to enum with fallback
-            event_str = row["event_manipulation"].lower()
-            try:
-                event = TriggerEvent(event_str)
-            except ValueError:
-                event = TriggerEvent.INSERT
-
-            # Map timing string to enum with fallback
-            timing_str = row["action_timing"].lower()
-            try:
-                timing = TriggerTiming(timing_str)
-            except ValueError:
-                timing = TriggerTiming.AFTER
-
+        for (
+            trigger_table,
+            trigger_name,
+            event_str,
+            timing_str,
+            action_statement,
+        ) in rows:
             triggers.append(
                 TriggerInfo(
-                    name=row["trigger_name"],
-                    table_name=table_name,
-                    event=event,
-                    timing=timing,
-                    definition=row["action_statement"] or "",
+                    name=trigger_name,
+                    table_name=trigger_table,
+                    event=_TRIGGER_EVENT_MAP.get(
+                        _lower(event_str), TriggerEvent.INSERT
+                    ),
+                    timing=_TRIGGER_TIMING_MAP.get(
+                        _lower(timing_str), TriggerTiming.AFTER
+                    ),
+                    definition=action_statement or "",
                 )
             )
 
@@ -1203,22 +1825,41 @@ def _get_postgresql_triggers_fallback(
 
 
 def _get_mysql_triggers(
-    connector: DatabaseConnector, table_name: str, schema_name: Optional[str]
+    connector: DatabaseConnector, table_name: Optional[str], schema_name: Optional[str]
 ) -> List[TriggerInfo]:
-    sql = f"SHOW TRIGGERS LIKE '{table_name}'"
+    sql = """
+    SELECT event_object_table, trigger_name, event_manipulation, action_timing,
+        action_statement
+    FROM information_schema.triggers
+    WHERE event_object_schema = COALESCE(:schema_name, DATABASE())
+    AND (:table_name IS NULL OR event_object_table = :table_name)
+    ORDER BY event_object_table, trigger_name
+    """
 
     try:
-        results = connector.execute_safe_sql(sql)
+        rows = connector.execute_internal_rows(
+            sql, {"table_name": table_name, "schema_name": schema_name}
+        )
         triggers = []
 
-        for row in results:
+        for (
+            trigger_table,
+            trigger_name,
+            event_str,
+            timing_str,
+            action_statement,
+        ) in rows:
             triggers.append(
                 TriggerInfo(
-                    name=row.get("Trigger", ""),
-                    table_name=table_name,
-                    event=row.get("Event", "").lower(),
-                    timing=row.get("Timing", "").lower(),
-                    definition=row.get("Statement", ""),
+                    name=trigger_name or "",
+                    table_name=trigger_table,
+                    event=_TRIGGER_EVENT_MAP.get(
+                        _lower(event_str), TriggerEvent.INSERT
+                    ),
+                    timing=_TRIGGER_TIMING_MAP.get(
+                        _lower(timing_str), TriggerTiming.AFTER
+                    ),
+                    definition=action_statement or "",
                 )
             )
 
@@ -1230,28 +1871,18 @@ def _get_mysql_triggers(
 def _get_postgresql_functions(
     connector: DatabaseConnector, schema_name: Optional[str]
 ) -> List[StoredProcedureInfo]:
-    schema_filter = f"AND n.nspname = '{schema_name}'" if schema_name else ""
-    sql = f"""
+    sql = """
     SELECT 
         p.proname as name,
         n.nspname as schema_name,
-        CASE p.prokind
-            WHEN 'f' THEN 'function'
-            WHEN 'p' THEN 'procedure'
-            WHEN 'a' THEN 'aggregate'
-            WHEN 'w' THEN 'window'
-            ELSE 'function'
-        END as routine_type,
         CASE 
             WHEN p.prorettype = 0 THEN 'void'
             ELSE format_type(p.prorettype, NULL)
         END as return_type,
         p.proargnames as arg_names,
         oidvectortypes(p.proargtypes) as arg_types,
-        p.pronargs as arg_count,
         pg_get_functiondef(p.oid) as definition,
         l.lanname as language,
-        p.proisstrict as is_strict,
         p.prosecdef as security_definer,
         CASE p.provolatile
             WHEN 'i' THEN true  -- immutable
@@ -1265,29 +1896,40 @@ def _get_postgresql_functions(
     JOIN pg_language l ON p.prolang = l.oid
     WHERE n.nspname NOT IN ('information_schema', 'pg_catalog', 'pg_toast', 'pg_temp_1')
     AND p.prokind IN ('f', 'p')  -- functions and procedures only
-    {schema_filter}
+    AND (CAST(:schema_name AS text) IS NULL OR n.nspname = :schema_name)
     ORDER BY n.nspname, p.proname
     """
 
     try:
-        results = connector.execute_safe_sql(sql)
+        rows = connector.execute_internal_rows(sql, {"schema_name": schema_name})
         procedures = []
 
-        for row in results:
+        for (
+            name,
+            routine_schema,
+            return_type,
+            arg_names,
+            arg_types_str,
+            definition,
+            language,
+            security_definer,
+            is_deterministic,
+            description,
+        ) in rows:
             # Parse parameters
             parameters = []
-            if row["arg_names"] and row["arg_types"]:
-                arg_names = row["arg_names"]
-                arg_types = row["arg_types"].split(", ") if row["arg_types"] else []
+            if arg_names and arg_types_str:
+                arg_types = arg_types_str.split(", ")
 
                 # Handle case where arg_names might be a PostgreSQL array string
-                if (
-                    isinstance(arg_names, str)
-                    and arg_names.startswith("{")
-                    and arg_names.endswith("}")
-                ):
-                    # Parse PostgreSQL array format like {arg1,arg2,arg3}
-                    names = arg_names[1:-1].split(",") if len(arg_names) > 2 else []
+                # like {arg1,"",arg3}; positions matter, so empties are kept
+                body = (
+                    _PG_ARRAY_BODY_RE.fullmatch(arg_names)
+                    if isinstance(arg_names, str)
+                    else None
+                )
+                if body:
+                    names = [n.strip('"') for n in body.group(1).split(",")]
                 elif isinstance(arg_names, list):
                     names = arg_names
                 else:
@@ -1299,29 +1941,27 @@ def _get_postgresql_functions(
                         names[i] if i < len(names) and names[i] else f"param_{i + 1}"
                     )
                     parameters.append(
-                        {
-                            "name": param_name,
-                            "type": arg_type.strip(),
-                            "mode": "IN",  # PostgreSQL default
-                        }
+                        ProcParameter(
+                            name=param_name,
+                            type=arg_type.strip(),
+                            mode="IN",  # PostgreSQL default
+                        )
                     )
 
             # Determine security type
-            security_type = "DEFINER" if row.get("security_definer") else "INVOKER"
+            security_type = "DEFINER" if security_definer else "INVOKER"
 
             procedures.append(
                 StoredProcedureInfo(
-                    name=row["name"],
-                    schema_name=row["schema_name"],
+                    name=name,
+                    schema_name=routine_schema,
                     parameters=parameters,
-                    return_type=row["return_type"]
-                    if row["return_type"] != "void"
-                    else None,
-                    definition=row["definition"] or "",
-                    language=row["language"] or "sql",
-                    is_deterministic=row.get("is_deterministic", False),
+                    return_type=return_type if return_type != "void" else None,
+                    definition=definition or "",
+                    language=language or "sql",
+                    is_deterministic=is_deterministic or False,
                     security_type=security_type,
-                    description=row.get("description"),
+                    description=description,
                 )
             )
 
@@ -1335,24 +1975,24 @@ def _get_postgresql_functions_fallback(
     connector: DatabaseConnector, schema_name: Optional[str]
 ) -> List[StoredProcedureInfo]:
     """Fallback to basic query if the comprehensive PostgreSQL functions query fails."""
-    schema_filter = f"AND n.nspname = '{schema_name}'" if schema_name else ""
-    sql = f"""
+    sql = """
     SELECT p.proname as name, n.nspname as schema_name, pg_get_functiondef(p.oid) as definition
     FROM pg_proc p
     JOIN pg_namespace n ON p.pronamespace = n.oid
-    WHERE n.nspname NOT IN ('information_schema', 'pg_catalog', 'pg_toast') {schema_filter}
+    WHERE n.nspname NOT IN ('information_schema', 'pg_catalog', 'pg_toast')
+    AND (CAST(:schema_name AS text) IS NULL OR n.nspname = :schema_name)
     """
 
     try:
-        results = connector.execute_safe_sql(sql)
+        rows = connector.execute_internal_rows(sql, {"schema_name": schema_name})
         procedures = []
 
-        for row in results:
+        for name, routine_schema, definition in rows:
             procedures.append(
                 StoredProcedureInfo(
-                    name=row["name"],
-                    schema_name=row["schema_name"],
-                    definition=row["definition"] or "",
+                    name=name,
+                    schema_name=routine_schema,
+                    definition=definition or "",
                     language="plpgsql",
                 )
             )
@@ -1365,23 +2005,23 @@ def _get_postgresql_functions_fallback(
 def _get_mysql_procedures(
     connector: DatabaseConnector, schema_name: Optional[str]
 ) -> List[StoredProcedureInfo]:
-    schema_filter = f"AND ROUTINE_SCHEMA = '{schema_name}'" if schema_name else ""
-    sql = f"""
-    SELECT ROUTINE_NAME, ROUTINE_SCHEMA, ROUTINE_DEFINITION, ROUTINE_TYPE
+    sql = """
+    SELECT ROUTINE_NAME, ROUTINE_SCHEMA, ROUTINE_DEFINITION
     FROM information_schema.ROUTINES
-    WHERE ROUTINE_TYPE IN ('PROCEDURE', 'FUNCTION') {schema_filter}
+    WHERE ROUTINE_TYPE IN ('PROCEDURE', 'FUNCTION')
+    AND (:schema_name IS NULL OR ROUTINE_SCHEMA = :schema_name)
     """
 
     try:
-        results = connector.execute_safe_sql(sql)
+        rows = connector.execute_internal_rows(sql, {"schema_name": schema_name})
         procedures = []
 
-        for row in results:
+        for name, routine_schema, definition in rows:
             procedures.append(
                 StoredProcedureInfo(
-                    name=row["ROUTINE_NAME"],
-                    schema_name=row["ROUTINE_SCHEMA"],
-                    definition=row["ROUTINE_DEFINITION"] or "",
+                    name=name,
+                    schema_name=routine_schema,
+                    definition=definition or "",
                     language="sql",
                 )
             )
@@ -1391,44 +2031,232 @@ def _get_mysql_procedures(
         return []
 
 
+def _count_postgresql_functions(
+    connector: DatabaseConnector, schema_name: Optional[str]
+) -> int:
+    # Same filter as _get_postgresql_functions
+    sql = """
+    SELECT count(*)
+    FROM pg_proc p
+    JOIN pg_namespace n ON p.pronamespace = n.oid
+    WHERE n.nspname NOT IN ('information_schema', 'pg_catalog', 'pg_toast', 'pg_temp_1')
+    AND p.prokind IN ('f', 'p')
+    AND (CAST(:schema_name AS text) IS NULL OR n.nspname = :schema_name)
+    """
+    rows = connector.execute_internal_rows(sql, {"schema_name": schema_name})
+    return int(rows[0][0])
+
+
+def _count_mysql_procedures(
+    connector: DatabaseConnector, schema_name: Optional[str]
+) -> int:
+    # Same filter as _get_mysql_procedures
+    sql = """
+    SELECT count(*)
+    FROM information_schema.ROUTINES
+    WHERE ROUTINE_TYPE IN ('PROCEDURE', 'FUNCTION')
+    AND (:schema_name IS NULL OR ROUTINE_SCHEMA = :schema_name)
+    """
+    rows = connector.execute_internal_rows(sql, {"schema_name": schema_name})
+    return int(rows[0][0])
+
+
+# Dialect-specific catalog loaders used by DatabaseConnector; dialects without
+# an entry report no triggers or routines.
+_TRIGGER_LOADERS: Dict[
+    DatabaseType,
+    Callable[[DatabaseConnector, Optional[str], Optional[str]], List[TriggerInfo]],
+] = {
+    DatabaseType.POSTGRESQL: _get_postgresql_triggers,
+    DatabaseType.MYSQL: _get_mysql_triggers,
+}
+
+_ROUTINE_LOADERS: Dict[
+    DatabaseType,
+    Callable[[DatabaseConnector, Optional[str]], List[StoredProcedureInfo]],
+] = {
+    DatabaseType.POSTGRESQL: _get_postgresql_functions,
+    DatabaseType.MYSQL: _get_mysql_procedures,
+}
+
+_ROUTINE_COUNTERS: Dict[
+    DatabaseType, Callable[[DatabaseConnector, Optional[str]], int]
+] = {
+    DatabaseType.POSTGRESQL: _count_postgresql_functions,
+    DatabaseType.MYSQL: _count_mysql_procedures,
+}
+
+
+_TABLE_SUMMARY_METADATA = {"analysis_type": "table_summary"}
+_TRIGGER_SUMMARY_METADATA = {"analysis_type": "trigger_summary"}
+_PROCEDURE_SUMMARY_METADATA = {"analysis_type": "procedure_summary"}
+
+_TABLE_SUMMARY_OUTPUT = """
+Provide a concise analysis with:
+1. A 2-3 sentence summary of what this table represents and stores
+2. A brief explanation of how it relates to other tables in the system  
+3. Any insights about its likely business purpose based on column names and structure
+
+Keep the response focused on business/functional purpose rather than technical details.
+""".strip()
+
+_TRIGGER_SUMMARY_OUTPUT = """
+Provide a concise analysis with:
+1. A 2-3 sentence summary of what this trigger does and why it exists
+2. The business rule or process it implements
+3. Any notable implications for data consistency, auditing, or performance
+
+Keep the response focused on business purpose and impact rather than technical details.
+""".strip()
+
+_PROCEDURE_SUMMARY_OUTPUT = """
+Provide a concise analysis with:
+1. A 2-3 sentence summary of what this procedure does and its business purpose
+2. The type of operation it performs (e.g., data transformation, business calculation, reporting)
+3. Any insights about its role in the application's business processes
+
+Keep the response focused on business functionality rather than technical implementation.
+""".strip()
+
+
+# The static part of every table prompt, built once and cloned per table
+_TABLE_PROMPT_TEMPLATE = (
+    PromptBuilder()
+    .with_title("Database Table Analysis and Business Purpose Summary")
+    .extend_instructions(
+        [
+            "Analyze the provided database table structure and metadata",
+            "Identify what type of business data this table likely stores",
+            "Determine the table's role within the larger database system",
+            "Focus on business purpose rather than technical implementation details",
+            "Provide insights based on column names, types, and relationships",
+        ]
+    )
+    .extend_rules(
+        [
+            "Base analysis solely on the provided table structure and relationships",
+            "Keep the summary concise but informative (2-3 sentences)",
+            "Explain relationships in business terms, not technical terms",
+            "Avoid speculation beyond what can be reasonably inferred from column names",
+            "Focus on functional purpose rather than technical details",
+        ]
+    )
+    .set_output(_TABLE_SUMMARY_OUTPUT)
+)
+
+
+# Static parts of the trigger and procedure prompts, cloned per object
+_TRIGGER_PROMPT_TEMPLATE = (
+    PromptBuilder()
+    .with_title("Database Trigger Analysis and Business Purpose Summary")
+    .extend_instructions(
+        [
+            "Analyze the provided database trigger and its context",
+            "Identify the business purpose and logic of this trigger",
+            "Determine what business rules or automation this trigger implements",
+            "Explain the trigger's role in maintaining data integrity or business processes",
+            "Focus on business value rather than technical implementation details",
+        ]
+    )
+    .extend_rules(
+        [
+            "Base analysis solely on the trigger definition and table structure",
+            "Keep the summary concise but informative (2-3 sentences)",
+            "Explain the trigger's purpose in business terms",
+            "Identify potential performance implications if relevant",
+            "Avoid speculation beyond what can be reasonably inferred",
+            "Focus on what the trigger accomplishes, not how it's coded",
+        ]
+    )
+    .set_output(_TRIGGER_SUMMARY_OUTPUT)
+)
+
+_PROCEDURE_PROMPT_TEMPLATE = (
+    PromptBuilder()
+    .with_title("Database Stored Procedure Analysis and Business Purpose Summary")
+    .extend_instructions(
+        [
+            "Analyze the provided stored procedure and its database context",
+            "Identify the business function and purpose of this procedure",
+            "Determine what business process or operation this procedure performs",
+            "Explain the procedure's role in the application's business logic",
+            "Focus on business value and functional purpose rather than code implementation",
+        ]
+    )
+    .extend_rules(
+        [
+            "Base analysis solely on the procedure definition, parameters, and schema context",
+            "Keep the summary concise but informative (2-3 sentences)",
+            "Explain the procedure's business function in clear terms",
+            "Identify the type of operation (data processing, reporting, validation, etc.)",
+            "Avoid speculation beyond what can be reasonably inferred from the code",
+            "Focus on what the procedure accomplishes for the business",
+        ]
+    )
+    .set_output(_PROCEDURE_SUMMARY_OUTPUT)
+)
+
+
+def _lines_or_none(lines: Iterable[str]) -> str:
+    """Newline-join prompt detail lines, or "None" when there are none."""
+    return "\n".join(lines) or "None"
+
+
+def _column_detail(col: ColumnInfo) -> str:
+    primary_key = " (PRIMARY KEY)" if col.is_primary_key else ""
+    foreign_key = (
+        f" (FK to {col.foreign_key_table}.{col.foreign_key_column})"
+        if col.is_foreign_key
+        else ""
+    )
+    not_null = "" if col.is_nullable else " NOT NULL"
+    return f"{col.name}: {col.data_type.value}{primary_key}{foreign_key}{not_null}"
+
+
+def _key_column_detail(col: ColumnInfo) -> str:
+    primary_key = " (PK)" if col.is_primary_key else ""
+    foreign_key = " (FK)" if col.is_foreign_key else ""
+    not_null = "" if col.is_nullable else " NOT NULL"
+    return f"{col.name}: {col.data_type.value}{primary_key}{foreign_key}{not_null}"
+
+
 def generate_table_summary_prompt(
-    table_info: TableInfo, relationships: List[RelationshipInfo]
+    table_info: TableInfo,
+    relationships: List[RelationshipInfo],
+    relationship_index: Optional[Dict[str, List[RelationshipInfo]]] = None,
 ) -> str:
-    column_details = []
-    for col in table_info.columns:
-        detail = f"{col.name}: {col.data_type.value}"
-        if col.is_primary_key:
-            detail += " (PRIMARY KEY)"
-        if col.is_foreign_key:
-            detail += f" (FK to {col.foreign_key_table}.{col.foreign_key_column})"
-        if not col.is_nullable:
-            detail += " NOT NULL"
-        column_details.append(detail)
-
-    # Find relationships involving this table
+    column_details = [_column_detail(col) for col in table_info.columns]
+
+    # Find relationships involving this table; callers prompting for many
+    # tables pass an index (index_relationships_by_table) to skip a full scan
+    candidates = (
+        relationships
+        if relationship_index is None
+        else relationship_index.get(table_info.name, [])
+    )
+    table_name = table_info.name
     related_tables = set()
     table_relationships = []
-    for rel in relationships:
-        if rel.source_table == table_info.name:
+    for rel in candidates:
+        if rel.source_table == table_name:
             related_tables.add(rel.target_table)
             table_relationships.append(
                 f"References {rel.target_table}.{rel.target_column} via {rel.source_column}"
             )
-        elif rel.target_table == table_info.name:
+        elif rel.target_table == table_name:
             related_tables.add(rel.source_table)
             table_relationships.append(
                 f"Referenced by {rel.source_table}.{rel.source_column} via {rel.target_column}"
             )
 
-    constraint_info = []
-    for constraint in table_info.constraints:
-        constraint_info.append(
-            f"{constraint.name}: {constraint.type.value} on {constraint.columns}"
-        )
-
-    index_info = []
-    for index in table_info.indexes:
-        index_info.append(f"{index.name}: {index.index_type.value} on {index.columns}")
+    constraint_info = _lines_or_none(
+        f"{constraint.name}: {constraint.type.value} on {constraint.columns}"
+        for constraint in table_info.constraints
+    )
+    index_info = _lines_or_none(
+        f"{index.name}: {index.index_type.value} on {index.columns}"
+        for index in table_info.indexes
+    )
 
     row_info = (
         f"Estimated rows: {table_info.row_count}"
@@ -1449,36 +2277,7 @@ Type: {table_info.table_type}
 {size_info}"""
 
     pb = (
-        PromptBuilder()
-        .with_title("Database Table Analysis and Business Purpose Summary")
-        .extend_instructions(
-            [
-                "Analyze the provided database table structure and metadata",
-                "Identify what type of business data this table likely stores",
-                "Determine the table's role within the larger database system",
-                "Focus on business purpose rather than technical implementation details",
-                "Provide insights based on column names, types, and relationships",
-            ]
-        )
-        .extend_rules(
-            [
-                "Base analysis solely on the provided table structure and relationships",
-                "Keep the summary concise but informative (2-3 sentences)",
-                "Explain relationships in business terms, not technical terms",
-                "Avoid speculation beyond what can be reasonably inferred from column names",
-                "Focus on functional purpose rather than technical details",
-            ]
-        )
-        .set_output(
-            """
-Provide a concise analysis with:
-1. A 2-3 sentence summary of what this table represents and stores
-2. A brief explanation of how it relates to other tables in the system  
-3. Any insights about its likely business purpose based on column names and structure
-
-Keep the response focused on business/functional purpose rather than technical details.
-            """.strip()
-        )
+        _TABLE_PROMPT_TEMPLATE.clone()
         .add_supporting_info("Table Metadata", table_metadata, kind="text")
         .add_supporting_info(
             f"Columns ({len(table_info.columns)} total)",
@@ -1487,12 +2286,12 @@ Keep the response focused on business/functional purpose rather than technical d
         )
         .add_supporting_info(
             f"Constraints ({len(table_info.constraints)} total)",
-            "\n".join(constraint_info) if constraint_info else "None",
+            constraint_info,
             kind="text",
         )
         .add_supporting_info(
             f"Indexes ({len(table_info.indexes)} total)",
-            "\n".join(index_info) if index_info else "None",
+            index_info,
             kind="text",
         )
         .add_supporting_info(
@@ -1508,7 +2307,7 @@ Keep the response focused on business/functional purpose rather than technical d
             kind="text",
         )
         .add_metadata("table_name", table_info.name)
-        .add_metadata("analysis_type", "table_summary")
+        .extend_metadata(_TABLE_SUMMARY_METADATA)
     )
 
     return pb.render(RenderOptions(include_toc=False))
@@ -1522,63 +2321,33 @@ def generate_trigger_summary_prompt(
     # Extract trigger details
     trigger_metadata = f"""Trigger: {trigger_info.name}
 Table: {trigger_info.table_name}
-Event: {trigger_info.event.value.upper()}
-Timing: {trigger_info.timing.value.upper()}
+Event: {trigger_info.event.name}
+Timing: {trigger_info.timing.name}
 Enabled: {"Yes" if trigger_info.is_enabled else "No"}
 Language: Detected from definition"""
 
+    # Collect key columns (first 10 only) and PK/FK names in a single pass
+    primary_keys: List[str] = []
+    foreign_keys: List[str] = []
+    key_columns: List[str] = []
+    for i, col in enumerate(table_info.columns):
+        if col.is_primary_key:
+            primary_keys.append(col.name)
+        if col.is_foreign_key:
+            foreign_keys.append(col.name)
+        if i < 10:
+            key_columns.append(_key_column_detail(col))
+
     # Extract table context
     table_context = f"""Table: {table_info.name}
 Schema: {table_info.schema_name or "default"}
 Type: {table_info.table_type}
 Columns: {len(table_info.columns)} total
-Primary Keys: {[col.name for col in table_info.columns if col.is_primary_key]}
-Foreign Keys: {[col.name for col in table_info.columns if col.is_foreign_key]}"""
-
-    # Extract key columns for context
-    key_columns = []
-    for col in table_info.columns[:10]:  # Limit to first 10 columns
-        detail = f"{col.name}: {col.data_type.value}"
-        if col.is_primary_key:
-            detail += " (PK)"
-        if col.is_foreign_key:
-            detail += " (FK)"
-        if not col.is_nullable:
-            detail += " NOT NULL"
-        key_columns.append(detail)
+Primary Keys: {", ".join(primary_keys) or "None"}
+Foreign Keys: {", ".join(foreign_keys) or "None"}"""
 
     pb = (
-        PromptBuilder()
-        .with_title("Database Trigger Analysis and Business Purpose Summary")
-        .extend_instructions(
-            [
-                "Analyze the provided database trigger and its context",
-                "Identify the business purpose and logic of this trigger",
-                "Determine what business rules or automation this trigger implements",
-                "Explain the trigger's role in maintaining data integrity or business processes",
-                "Focus on business value rather than technical implementation details",
-            ]
-        )
-        .extend_rules(
-            [
-                "Base analysis solely on the trigger definition and table structure",
-                "Keep the summary concise but informative (2-3 sentences)",
-                "Explain the trigger's purpose in business terms",
-                "Identify potential performance implications if relevant",
-                "Avoid speculation beyond what can be reasonably inferred",
-                "Focus on what the trigger accomplishes, not how it's coded",
-            ]
-        )
-        .set_output(
-            """
-Provide a concise analysis with:
-1. A 2-3 sentence summary of what this trigger does and why it exists
-2. The business rule or process it implements
-3. Any notable implications for data consistency, auditing, or performance
-
-Keep the response focused on business purpose and impact rather than technical details.
-            """.strip()
-        )
+        _TRIGGER_PROMPT_TEMPLATE.clone()
         .add_supporting_info("Trigger Metadata", trigger_metadata, kind="text")
         .add_supporting_info("Table Context", table_context, kind="text")
         .add_supporting_info(
@@ -1593,7 +2362,7 @@ Keep the response focused on business purpose and impact rather than technical d
         )
         .add_metadata("trigger_name", trigger_info.name)
         .add_metadata("table_name", trigger_info.table_name)
-        .add_metadata("analysis_type", "trigger_summary")
+        .extend_metadata(_TRIGGER_SUMMARY_METADATA)
     )
 
     return pb.render(RenderOptions(include_toc=False))
@@ -1605,12 +2374,12 @@ def generate_stored_procedure_summary_prompt(
     """Generate AI prompt for analyzing a stored procedure."""
 
     # Extract procedure details
-    parameters_text = []
-    for param in procedure_info.parameters:
-        param_detail = f"{param.get('name', 'unknown')}: {param.get('type', 'unknown')}"
-        if param.get("mode"):
-            param_detail += f" ({param['mode']})"
-        parameters_text.append(param_detail)
+    parameters_text = _lines_or_none(
+        f"{param.name}: {param.type} ({param.mode})"
+        if param.mode
+        else f"{param.name}: {param.type}"
+        for param in procedure_info.parameters
+    )
 
     procedure_metadata = f"""Procedure: {procedure_info.name}
 Schema: {procedure_info.schema_name or "default"}
@@ -1627,42 +2396,12 @@ Security: {procedure_info.security_type or "INVOKER"}"""
         schema_context += "..."
 
     pb = (
-        PromptBuilder()
-        .with_title("Database Stored Procedure Analysis and Business Purpose Summary")
-        .extend_instructions(
-            [
-                "Analyze the provided stored procedure and its database context",
-                "Identify the business function and purpose of this procedure",
-                "Determine what business process or operation this procedure performs",
-                "Explain the procedure's role in the application's business logic",
-                "Focus on business value and functional purpose rather than code implementation",
-            ]
-        )
-        .extend_rules(
-            [
-                "Base analysis solely on the procedure definition, parameters, and schema context",
-                "Keep the summary concise but informative (2-3 sentences)",
-                "Explain the procedure's business function in clear terms",
-                "Identify the type of operation (data processing, reporting, validation, etc.)",
-                "Avoid speculation beyond what can be reasonably inferred from the code",
-                "Focus on what the procedure accomplishes for the business",
-            ]
-        )
-        .set_output(
-            """
-Provide a concise analysis with:
-1. A 2-3 sentence summary of what this procedure does and its business purpose
-2. The type of operation it performs (e.g., data transformation, business calculation, reporting)
-3. Any insights about its role in the application's business processes
-
-Keep the response focused on business functionality rather than technical implementation.
-            """.strip()
-        )
+        _PROCEDURE_PROMPT_TEMPLATE.clone()
         .add_supporting_info("Procedure Metadata", procedure_metadata, kind="text")
         .add_supporting_info("Schema Context", schema_context, kind="text")
         .add_supporting_info(
             f"Parameters ({len(procedure_info.parameters)} total)",
-            "\n".join(parameters_text) if parameters_text else "None",
+            parameters_text,
             kind="text",
         )
         .add_supporting_info(
@@ -1672,7 +2411,7 @@ Keep the response focused on business functionality rather than technical implem
         )
         .add_metadata("procedure_name", procedure_info.name)
         .add_metadata("schema_name", procedure_info.schema_name or "default")
-        .add_metadata("analysis_type", "procedure_summary")
+        .extend_metadata(_PROCEDURE_SUMMARY_METADATA)
     )
 
     return pb.render(RenderOptions(include_toc=False))
@@ -1682,7 +2421,7 @@ def _get_postgresql_unique_constraints(
     connector: DatabaseConnector, table_name: str, schema_name: Optional[str]
 ) -> List[ConstraintInfo]:
     """Get UNIQUE constraints for PostgreSQL (excluding primary keys)."""
-    schema_filter = f"AND tc.table_schema = '{schema_name}'" if schema_name else ""
+    schema_filter = "AND tc.table_schema = :schema_name" if schema_name else ""
 
     sql = f"""
     SELECT 
@@ -1693,33 +2432,24 @@ def _get_postgresql_unique_constraints(
         ON tc.constraint_name = kcu.constraint_name
         AND tc.table_schema = kcu.table_schema
     WHERE tc.constraint_type = 'UNIQUE'
-    AND tc.table_name = '{table_name}'
+    AND tc.table_name = :table_name
     {schema_filter}
     GROUP BY tc.constraint_name
     ORDER BY tc.constraint_name
     """
 
     try:
-        results = connector.execute_safe_sql(sql)
+        results = connector.execute_internal(
+            sql, {"table_name": table_name, "schema_name": schema_name}
+        )
         constraints = []
 
         for row in results:
             # Handle column arrays
-            constrained_columns = []
-            if row["constrained_columns"]:
-                if isinstance(row["constrained_columns"], list):
-                    constrained_columns = row["constrained_columns"]
-                else:
-                    # Parse PostgreSQL array format
-                    import re
-
-                    col_match = re.findall(r"[^{},]+", str(row["constrained_columns"]))
-                    constrained_columns = [
-                        col.strip('"') for col in col_match if col.strip()
-                    ]
+            constrained_columns = _parse_pg_array(row["constrained_columns"])
 
             constraints.append(
-                ConstraintInfo(
+                ConstraintInfo.from_catalog(
                     name=row["constraint_name"],
                     type=ConstraintType.UNIQUE,
                     columns=constrained_columns,
@@ -1736,7 +2466,7 @@ def _get_mysql_unique_constraints(
 ) -> List[ConstraintInfo]:
     """Get UNIQUE constraints for MySQL (excluding primary keys)."""
     schema_filter = (
-        f"AND table_schema = '{schema_name}'"
+        "AND table_schema = :schema_name"
         if schema_name
         else "AND table_schema = DATABASE()"
     )
@@ -1750,30 +2480,29 @@ def _get_mysql_unique_constraints(
         SELECT constraint_name 
         FROM information_schema.table_constraints 
         WHERE constraint_type = 'UNIQUE'
-        AND table_name = '{table_name}'
+        AND table_name = :table_name
         {schema_filter}
     )
-    AND table_name = '{table_name}'
+    AND table_name = :table_name
     {schema_filter}
     ORDER BY constraint_name, ordinal_position
     """
 
     try:
-        results = connector.execute_safe_sql(sql)
+        results = connector.execute_internal(
+            sql, {"table_name": table_name, "schema_name": schema_name}
+        )
         constraints_dict: Dict[str, List[str]] = {}
 
         for row in results:
-            constraint_name = row["constraint_name"]
-            column_name = row["column_name"]
-
-            if constraint_name not in constraints_dict:
-                constraints_dict[constraint_name] = []
-            constraints_dict[constraint_name].append(column_name)
+            constraints_dict.setdefault(row["constraint_name"], []).append(
+                row["column_name"]
+            )
 
         constraints = []
         for constraint_name, columns in constraints_dict.items():
             constraints.append(
-                ConstraintInfo(
+                ConstraintInfo.from_catalog(
                     name=constraint_name,
                     type=ConstraintType.UNIQUE,
                     columns=columns,
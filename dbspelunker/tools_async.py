@@ -0,0 +1,77 @@
+"""
+Asyncio entry points for the introspection tools.
+
+These are thread offloads, not native async database access: each call runs
+the synchronous SQLAlchemy tool from tools.py in a worker thread via
+asyncio.to_thread (there is no AsyncEngine), so the event loop stays free
+while catalog queries run.
+"""
+
+import asyncio
+from typing import List, Optional
+
+from .models import DatabaseOverview, RelationshipInfo, TableInfo
+from .tools import (
+    analyze_relationships_tool,
+    get_database_overview_tool,
+    get_table_schema_tool,
+    get_tables_schema_tool,
+)
+
+# Keep concurrent introspection well within the shared engine's connection pool
+_MAX_CONCURRENCY = 8
+
+
+async def get_database_overview_tool_async(
+    connection_string: str, concurrency: int = _MAX_CONCURRENCY
+) -> DatabaseOverview:
+    """Build the overview, summarizing up to `concurrency` schemas at a time."""
+    return await asyncio.to_thread(
+        get_database_overview_tool, connection_string, concurrency
+    )
+
+
+async def get_table_schema_tool_async(
+    connection_string: str,
+    table_name: str,
+    schema_name: Optional[str] = None,
+    include_triggers: bool = False,
+) -> TableInfo:
+    return await asyncio.to_thread(
+        get_table_schema_tool,
+        connection_string,
+        table_name,
+        schema_name,
+        include_triggers,
+    )
+
+
+async def get_table_schemas_tool_async(
+    connection_string: str,
+    table_names: List[str],
+    schema_name: Optional[str] = None,
+    concurrency: int = _MAX_CONCURRENCY,
+    include_triggers: bool = False,
+) -> List[TableInfo]:
+    """
+    Describe several tables, returned in the order requested.
+
+    Uses the batched reflection of get_tables_schema_tool in one worker thread,
+    which fans out per-table queries itself (up to `concurrency` at a time).
+    """
+    return await asyncio.to_thread(
+        get_tables_schema_tool,
+        connection_string,
+        schema_name,
+        table_names,
+        include_triggers,
+        max_workers=concurrency,
+    )
+
+
+async def analyze_relationships_tool_async(
+    connection_string: str, schema_name: Optional[str] = None
+) -> List[RelationshipInfo]:
+    return await asyncio.to_thread(
+        analyze_relationships_tool, connection_string, schema_name
+    )
@@ -44,7 +44,7 @@ def main() -> None:
         )
 
         # Generate full documentation with AI summaries
-        documentation = spelunker.generate_full_documentation()
+        documentation = spelunker.generate_full_documentation(overview=overview)
         documentation.to_markdown(path=output_path, include_json_appendix=False)
 
         print("Documentation generated successfully!")
@@ -0,0 +1,64 @@
+import pytest
+
+from dbspelunker.tools import SQLSafetyValidator
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT 1",
+        "SELECT 1;",
+        "SELECT ';'",
+        "SELECT * FROM t WHERE s = 'a;b'",
+        "SELECT * FROM t WHERE s = 'it''s; fine'",
+        'SELECT "delete" FROM t',
+        'SELECT "a;b" FROM t',
+        "SELECT `update` FROM t",
+        "SELECT t.update, t.delete FROM t",
+        "SELECT created_at, update_time FROM t",
+        "SELECT 'drop table t' AS note",
+        "SELECT 1 -- no; second statement here\n",
+        "SELECT 1 -- trailing comment",
+        "SELECT /* ; */ 1",
+        "SELECT * FROM t WHERE id = $1",
+        "EXPLAIN SELECT * FROM t",
+        "SHOW TABLES",
+    ],
+)
+def test_accepts_readonly_sql(sql: str) -> None:
+    assert SQLSafetyValidator.validate_readonly_sql(sql)
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "",
+        "DELETE FROM t",
+        "SELECT 1; DELETE FROM t",
+        "SELECT 1;DELETE FROM t",
+        "SELECT ';'; DROP TABLE t",
+        "SELECT 'a' ; UPDATE t SET x = 1",
+        "WITH d AS (DELETE FROM t RETURNING *) SELECT * FROM d",
+        "SELECT 'unterminated; DROP TABLE t",
+        "SELECT 1 /* unterminated; DROP TABLE t",
+        "SELECT 1 -- comment\n; DROP TABLE t",
+        "SELECT * INTO x FROM t; TRUNCATE t",
+        "SELECT /* ; DROP */ 1",
+        "SELECT 1 -- DELETE FROM t",
+        # Dollar quoting and backslash escapes hide the quote that would
+        # otherwise swallow the second statement
+        "SELECT $$'$$; DELETE FROM t; --'",
+        "SELECT $q$'$q$; DROP TABLE t; --'",
+        "SELECT E'\\''; DELETE FROM t; --'",
+        "SELECT '\\''; DELETE FROM t; -- '",
+        'SELECT "\\"";DELETE FROM t;SELECT "',
+        # Comment forms the dialects disagree on
+        "SELECT 1--1;COMMIT",
+        "SELECT 1 # '\n;DELETE FROM t -- '",
+        "SELECT 1 /*!;DELETE FROM t*/",
+        "SELECT 1 /* /* */ ' */ ;DELETE FROM t; -- '",
+        "SELECT 1 -- x\r;DELETE FROM t",
+    ],
+)
+def test_rejects_unsafe_sql(sql: str) -> None:
+    assert not SQLSafetyValidator.validate_readonly_sql(sql)